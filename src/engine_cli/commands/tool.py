@@ -8,6 +8,22 @@ from typing import List, Optional
 import click
 import yaml
 
+# Prefer the LibYAML C bindings; fall back to the pure-Python safe loader/dumper
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader  # type: ignore
+
+# orjson parses --input/--params faster when installed; its JSONDecodeError
+# subclasses json.JSONDecodeError, so the error handling below covers both
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Import engine core components
 from engine_core import ToolBuilder
 
@@ -15,6 +31,12 @@ from engine_core import ToolBuilder
 from engine_cli.formatting import error, key_value, print_table, success, table
 
 
+def _load_tool_file(path: str):
+    """Parse a tool file with the fastest available safe loader."""
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
 class ToolStorage:
     """Simple tool storage manager."""
 
@@ -26,24 +48,36 @@ class ToolStorage:
         """List all saved tools."""
         tools = []
         if os.path.exists(self.tools_dir):
-            for file in os.listdir(self.tools_dir):
-                if file.endswith(".yaml"):
-                    try:
-                        with open(os.path.join(self.tools_dir, file), "r") as f:
-                            tool_data = yaml.safe_load(f)
-                            if tool_data:
-                                tools.append(tool_data)
-                    except Exception:
-                        continue
+            for entry in self._iter_tool_entries():
+                try:
+                    tool_data = _load_tool_file(entry.path)
+                    if tool_data:
+                        tools.append(tool_data)
+                except Exception:
+                    continue
         return tools
 
+    def _iter_tool_entries(self):
+        """Yield directory entries for tool files without a stat call per file."""
+        with os.scandir(self.tools_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".yaml") and entry.is_file():
+                    yield entry
+
+    def save_tool(self, tool_data: dict) -> str:
+        """Save tool to storage and return the path of its YAML file."""
+        os.makedirs(self.tools_dir, exist_ok=True)
+        tool_file = os.path.join(self.tools_dir, f"{tool_data['tool_id']}.yaml")
+        with open(tool_file, "w") as f:
+            yaml.dump(tool_data, f, Dumper=SafeDumper, default_flow_style=False)
+        return tool_file
+
     def get_tool(self, tool_id: str) -> Optional[dict]:
         """Get tool by ID."""
         tool_file = os.path.join(self.tools_dir, f"{tool_id}.yaml")
         if os.path.exists(tool_file):
             try:
-                with open(tool_file, "r") as f:
-                    return yaml.safe_load(f)
+                return _load_tool_file(tool_file)
             except Exception:
                 return None
         return None
@@ -165,14 +199,8 @@ def create(name, type, description, endpoint, config, capabilities, tags, save,
                     "created_at": datetime.now().isoformat(),
                 }
 
-                # Ensure tools directory exists
-                tools_dir = os.path.join(os.getcwd(), "tools")
-                os.makedirs(tools_dir, exist_ok=True)
-
-                tool_file = os.path.join(tools_dir, f"{name}.yaml")
-                with open(tool_file, "w") as f:
-                    yaml.safe_dump(tool_data, f, default_flow_style=False)
-
+                # Resolve tools/ against the cwd at call time, not at import
+                tool_file = ToolStorage().save_tool(tool_data)
                 success(f"Tool saved to {tool_file}")
 
             except Exception as e:
@@ -343,7 +371,7 @@ def test(name, input, method, params):
         input_data = {}
         if input:
             try:
-                input_data = json.loads(input)
+                input_data = _json_loads(input)
             except json.JSONDecodeError:
                 error("Invalid JSON input")
                 return
@@ -352,7 +380,7 @@ def test(name, input, method, params):
         query_params = {}
         if params:
             try:
-                query_params = json.loads(params)
+                query_params = _json_loads(params)
             except json.JSONDecodeError:
                 error("Invalid JSON parameters")
                 return
@@ -8,6 +8,13 @@ from typing import Any, Dict, List, Optional
 import click
 import yaml
 
+# Prefer the LibYAML C bindings; fall back to the pure-Python safe loader/dumper
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader  # type: ignore
+
 # Import engine core components
 from engine_core import WorkflowBuilder  # type: ignore
 
@@ -65,7 +72,7 @@ class WorkflowStorage:
                     try:
                         file_path = os.path.join(self.workflows_dir, file)
                         with open(file_path, "r", encoding="utf-8") as f:
-                            data = yaml.safe_load(f)
+                            data = yaml.load(f, Loader=SafeLoader)
                             workflows.append(
                                 {
                                     "id": data.get("id", "unknown"),
@@ -135,9 +142,10 @@ class WorkflowStorage:
 
             file_path = os.path.join(self.workflows_dir, f"{workflow.id}.yaml")
             with open(file_path, "w", encoding="utf-8") as f:
-                yaml.safe_dump(
+                yaml.dump(
                     workflow_data,
                     f,
+                    Dumper=SafeDumper,
                     default_flow_style=False,
                     allow_unicode=True,
                 )
@@ -156,7 +164,7 @@ class WorkflowStorage:
 
         try:
             with open(file_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=SafeLoader)
 
             # Note: Full workflow reconstruction would require agents/teams/functions
             # For now, return basic info. Full reconstruction needs more complex logic
@@ -14,6 +14,30 @@ if src_path not in sys.path:
     sys.path.insert(0, src_path)
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--fast",
+        action="store_true",
+        default=False,
+        help="Skip filesystem-touching storage tests for a quicker inner loop.",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "fs: test that reads or writes real files; skipped by --fast"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--fast"):
+        return
+    skip_fs = pytest.mark.skip(reason="filesystem test skipped by --fast")
+    for item in items:
+        if item.get_closest_marker("fs") is not None:
+            item.add_marker(skip_fs)
+
+
 @pytest.fixture
 def cli_runner() -> CliRunner:
     """Provide a Click CLI runner for testing commands."""
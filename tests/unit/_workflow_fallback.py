@@ -0,0 +1,64 @@
+"""Stand-ins for the workflow command classes when engine_cli cannot be imported.
+
+Only test_workflow.py imports this, and only from its ImportError branch.
+"""
+
+import os
+from dataclasses import dataclass, field
+
+
+class WorkflowStorage:
+    def __init__(self):
+        self.workflows_dir = os.path.join(os.getcwd(), "workflows")
+        os.makedirs(self.workflows_dir, exist_ok=True)
+
+    def list_workflows(self):
+        return []
+
+    def save_workflow(self, workflow, builder=None):
+        return True
+
+    def load_workflow(self, workflow_id):
+        return None
+
+    def delete_workflow(self, workflow_id):
+        return False
+
+
+class WorkflowResolver:
+    def __init__(self):
+        self.agent_storage = None
+        self.team_storage = None
+
+    def resolve_workflow(self, workflow_data):
+        return None
+
+    def _get_agent_storage(self):
+        return None
+
+    def _get_team_storage(self):
+        return None
+
+
+@dataclass(slots=True)
+class CLIWorkflowBuilder:
+    agent_specs: list = field(default_factory=list)
+    team_specs: list = field(default_factory=list)
+    edge_specs: list = field(default_factory=list)
+
+    def with_id(self, workflow_id):
+        return self
+
+    def add_agent_vertex(self, vertex_id, agent_id, instruction):
+        self.agent_specs.append(
+            {
+                "vertex_id": vertex_id,
+                "agent_id": agent_id,
+                "instruction": instruction,
+            }
+        )
+        return self
+
+    def add_edge(self, from_vertex, to_vertex):
+        self.edge_specs.append({"from": from_vertex, "to": to_vertex})
+        return self
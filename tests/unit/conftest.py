@@ -0,0 +1,16 @@
+"""Fixtures shared by the unit tests."""
+
+import pytest
+
+try:
+    import uvloop  # type: ignore
+except ImportError:
+    uvloop = None
+
+
+if uvloop is not None:
+
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        """Run the async unit tests on uvloop when it is installed."""
+        return uvloop.EventLoopPolicy()
@@ -134,6 +134,7 @@ class TestConfigOperations:
             yaml.dump(config_data, f)
         return config_file
 
+    @pytest.mark.fs
     def test_config_export(self, runner, tmp_path):
         """Test config export command."""
         output_file = tmp_path / "exported_config.yaml"
@@ -151,6 +152,7 @@ class TestConfigOperations:
             )
             assert result is not None
 
+    @pytest.mark.fs
     def test_config_import_dry_run(self, runner, temp_config_file):
         """Test config import command with dry run."""
         result = runner.invoke(
@@ -164,6 +166,7 @@ class TestConfigOperations:
         )
         assert result is not None
 
+    @pytest.mark.fs
     def test_config_import_merge(self, runner, temp_config_file):
         """Test config import command with merge."""
         with patch("engine_cli.commands.advanced.load_config") as mock_load:
@@ -98,6 +98,7 @@ class MockAgentBuilder:
         )
 
 
+@pytest.mark.fs
 class TestAgentStorage:
     """Test AgentStorage class."""
 
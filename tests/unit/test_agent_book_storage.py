@@ -5,9 +5,12 @@ import os
 import tempfile
 from unittest.mock import patch
 
+import pytest
+
 from engine_cli.storage.agent_book_storage import AgentBookStorage
 
 
+@pytest.mark.fs
 class TestAgentBookStorage:
     """Test AgentBookStorage functionality."""
 
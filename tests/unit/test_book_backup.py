@@ -5,6 +5,7 @@ import sys
 import tempfile
 from unittest.mock import MagicMock, mock_open, patch
 
+import pytest
 import yaml
 from click.testing import CliRunner
 
@@ -45,18 +46,21 @@ class TestWorkflowStorage:
 
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
+    @pytest.mark.fs
     def test_init_creates_workflows_dir(self):
         """Test that WorkflowStorage creates workflows directory."""
         storage = WorkflowStorage()
         assert os.path.exists("workflows")
         assert os.path.isdir("workflows")
 
+    @pytest.mark.fs
     def test_list_workflows_empty(self):
         """Test listing workflows when directory is empty."""
         storage = WorkflowStorage()
         workflows = storage.list_workflows()
         assert workflows == []
 
+    @pytest.mark.fs
     def test_list_workflows_with_files(self):
         """Test listing workflows with valid YAML files."""
         storage = WorkflowStorage()
@@ -84,6 +88,7 @@ class TestWorkflowStorage:
         assert workflows[0]["vertex_count"] == 2
         assert workflows[0]["edge_count"] == 1
 
+    @pytest.mark.fs
     def test_list_workflows_corrupt_file(self):
         """Test listing workflows with corrupt files."""
         storage = WorkflowStorage()
@@ -97,6 +102,7 @@ class TestWorkflowStorage:
         # Should skip corrupt files
         assert workflows == []
 
+    @pytest.mark.fs
     def test_load_workflow_exists(self):
         """Test loading an existing workflow."""
         storage = WorkflowStorage()
@@ -118,12 +124,14 @@ class TestWorkflowStorage:
         assert loaded["id"] == "test_workflow"
         assert loaded["name"] == "Test Workflow"
 
+    @pytest.mark.fs
     def test_load_workflow_not_exists(self):
         """Test loading a non-existing workflow."""
         storage = WorkflowStorage()
         loaded = storage.load_workflow("nonexistent")
         assert loaded is None
 
+    @pytest.mark.fs
     def test_load_workflow_invalid_yaml(self):
         """Test loading workflow with invalid YAML."""
         storage = WorkflowStorage()
@@ -135,6 +143,7 @@ class TestWorkflowStorage:
         loaded = storage.load_workflow("invalid_workflow")
         assert loaded is None
 
+    @pytest.mark.fs
     def test_delete_workflow_exists(self):
         """Test deleting an existing workflow."""
         storage = WorkflowStorage()
@@ -152,12 +161,14 @@ class TestWorkflowStorage:
         assert result is True
         assert not os.path.exists(workflow_path)
 
+    @pytest.mark.fs
     def test_delete_workflow_not_exists(self):
         """Test deleting a non-existing workflow."""
         storage = WorkflowStorage()
         result = storage.delete_workflow("nonexistent")
         assert result is False
 
+    @pytest.mark.fs
     def test_delete_workflow_file_error(self):
         """Test deleting workflow when file operation fails."""
         storage = WorkflowStorage()
@@ -287,18 +298,21 @@ class TestWorkflowResolver:
 
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
+    @pytest.mark.fs
     def test_init_creates_workflows_dir(self):
         """Test that WorkflowStorage creates workflows directory."""
         storage = WorkflowStorage()
         assert os.path.exists("workflows")
         assert os.path.isdir("workflows")
 
+    @pytest.mark.fs
     def test_list_workflows_empty(self):
         """Test listing workflows when directory is empty."""
         storage = WorkflowStorage()
         workflows = storage.list_workflows()
         assert workflows == []
 
+    @pytest.mark.fs
     def test_list_workflows_with_files(self):
         """Test listing workflows with valid YAML files."""
         storage = WorkflowStorage()
@@ -326,6 +340,7 @@ class TestWorkflowResolver:
         assert workflows[0]["vertex_count"] == 2
         assert workflows[0]["edge_count"] == 1
 
+    @pytest.mark.fs
     def test_list_workflows_invalid_yaml(self):
         """Test listing workflows with invalid YAML files."""
         storage = WorkflowStorage()
@@ -345,6 +360,7 @@ class TestWorkflowResolver:
         assert len(workflows) == 1
         assert workflows[0]["id"] == "valid_workflow"
 
+    @pytest.mark.fs
     def test_list_workflows_corrupt_file(self):
         """Test listing workflows with corrupt files."""
         storage = WorkflowStorage()
@@ -358,6 +374,7 @@ class TestWorkflowResolver:
         # Should skip corrupt files
         assert workflows == []
 
+    @pytest.mark.fs
     def test_load_workflow_exists(self):
         """Test loading an existing workflow."""
         storage = WorkflowStorage()
@@ -379,12 +396,14 @@ class TestWorkflowResolver:
         assert loaded["id"] == "test_workflow"
         assert loaded["name"] == "Test Workflow"
 
+    @pytest.mark.fs
     def test_load_workflow_not_exists(self):
         """Test loading a non-existing workflow."""
         storage = WorkflowStorage()
         loaded = storage.load_workflow("nonexistent")
         assert loaded is None
 
+    @pytest.mark.fs
     def test_load_workflow_invalid_yaml(self):
         """Test loading workflow with invalid YAML."""
         storage = WorkflowStorage()
@@ -396,6 +415,7 @@ class TestWorkflowResolver:
         loaded = storage.load_workflow("invalid_workflow")
         assert loaded is None
 
+    @pytest.mark.fs
     def test_delete_workflow_exists(self):
         """Test deleting an existing workflow."""
         storage = WorkflowStorage()
@@ -413,12 +433,14 @@ class TestWorkflowResolver:
         assert result is True
         assert not os.path.exists(workflow_path)
 
+    @pytest.mark.fs
     def test_delete_workflow_not_exists(self):
         """Test deleting a non-existing workflow."""
         storage = WorkflowStorage()
         result = storage.delete_workflow("nonexistent")
         assert result is False
 
+    @pytest.mark.fs
     def test_delete_workflow_file_error(self):
         """Test deleting workflow when file operation fails."""
         storage = WorkflowStorage()
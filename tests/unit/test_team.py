@@ -1,52 +1,137 @@
+import importlib
 import os
-import tempfile
+import sys
+from contextlib import ExitStack, nullcontext
+from enum import Enum
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import MagicMock, mock_open, patch
 
-try:
-    import pytest  # type: ignore
-
-    PYTEST_AVAILABLE = True
-except ImportError:
-    PYTEST_AVAILABLE = False
-
-    class MockMark:
-        def asyncio(self, func=None):
-            """Mock asyncio marker that can be used as decorator"""
-            if func is None:
-                # Called as @pytest.mark.asyncio()
-                return lambda f: f
-            else:
-                # Called as @pytest.mark.asyncio
-                return func
-
-    class MockPytest:
-        def __init__(self):
-            self.mark = MockMark()
-            self.fixture = lambda f: f
-
-        def raises(self, *args, **kwargs):
-            # Mock implementation
-            class MockContext:
-                def __enter__(self):
-                    return self
-
-                def __exit__(self, exc_type, exc_val, exc_tb):
-                    return None
-
-            return MockContext()
-
-        def skip(self, reason):
-            raise Exception(f"Skipped: {reason}")
-
-        @staticmethod
-        def main(args):
-            pass
-
-    pytest = MockPytest()
-
+import pytest
 import yaml
 from click.testing import CliRunner
 
+import engine_cli.commands.team as team_module
+from engine_cli.commands.team import TeamStorage, create, delete, get_team_storage
+from engine_cli.commands.team import list as list_cmd
+from engine_cli.commands.team import show
+
+# Canonical team records, frozen so no test can mutate the shared copies.
+# Storage stubs hand out shallow dict copies since the CLI json/yaml dumpers
+# cannot serialize a mappingproxy.
+_TEAM_1 = MappingProxyType(
+    {
+        "id": "test_team_1",
+        "name": "Test Team 1",
+        "coordination_strategy": "collaborative",
+        "agents": ("agent1", "agent2"),
+        "leader": "agent1",
+        "description": "A test team",
+        "created_at": "2024-01-01T00:00:00",
+    }
+)
+
+_TEAM_2 = MappingProxyType(
+    {
+        "id": "test_team_2",
+        "name": "Test Team 2",
+        "coordination_strategy": "hierarchical",
+        "agents": ("agent3",),
+        "leader": "agent3",
+        "description": "Another test team",
+    }
+)
+
+_TEAMS = (_TEAM_1, _TEAM_2)
+
+# Team files for the TeamStorage tests, serialized once at import
+_VALID_TEAM_YAML = yaml.safe_dump({"id": "valid_team", "name": "Valid Team"})
+_TEST_TEAM_YAML = yaml.safe_dump({"id": "test_team", "name": "Test Team"})
+_CORRUPT_YAML = "invalid: yaml: content: [\n"
+
+
+# create-command argv, one tuple per parametrized case
+_ARGV_BASIC = (
+    "test_team",
+    "--agents",
+    "agent1,agent2",
+    "--strategy",
+    "collaborative",
+    "--description",
+    "A test team",
+    "--save",
+)
+_ARGV_HIERARCHICAL = (
+    "hierarchical_team",
+    "--agents",
+    "agent1,agent2,agent3",
+    "--leader",
+    "agent1",
+    "--strategy",
+    "hierarchical",
+    "--description",
+    "Hierarchical team",
+    "--save",
+)
+_ARGV_PARALLEL_STRATEGY = (
+    "parallel_team",
+    "--agents",
+    "agent1,agent2",
+    "--strategy",
+    "parallel",
+)
+_ARGV_SEQUENTIAL_STRATEGY = (
+    "sequential_team",
+    "--agents",
+    "agent1,agent2",
+    "--strategy",
+    "sequential",
+)
+_ARGV_NO_AGENTS = (
+    "empty_team",
+    "--strategy",
+    "collaborative",
+    "--description",
+    "Team without agents",
+)
+_ARGV_WITH_OUTPUT_FILE = (
+    "output_team",
+    "--agents",
+    "agent1,agent2",
+    "--output",
+    "custom_output.yaml",
+)
+_ARGV_SAVE_ERROR = ("failing_team", "--agents", "agent1", "--save")
+_ARGV_AGENT_CREATION_LOGIC = (
+    "agent_test_team",
+    "--agents",
+    "agent1, agent2 , agent3",  # Test whitespace handling
+    "--strategy",
+    "parallel",
+)
+_ARGV_EMPTY_AGENT_LIST = (
+    "empty_agents_team",
+    "--agents",
+    "",  # Empty agent list
+    "--strategy",
+    "collaborative",
+)
+_ARGV_WITH_LEADER = (
+    "leader_team",
+    "--agents",
+    "agent1,agent2,agent3",
+    "--leader",
+    "agent1",
+    "--strategy",
+    "hierarchical",
+)
+_ARGV_WHITESPACE_IN_AGENTS = (
+    "whitespace_team",
+    "--agents",
+    "  agent1  ,  agent2  , agent3 ",
+    "--strategy",
+    "parallel",
+)
+
 
 # Mock classes for engine-core dependencies
 class MockTeamBuilder:
@@ -78,18 +163,18 @@ class MockTeamBuilder:
         return self
 
     def build(self, agents=None):
-        team = MagicMock()
-        team.id = self.id
-        team.name = self.name
-        team.coordination_strategy = (
-            self.coordination_strategy.value
-            if self.coordination_strategy is not None
-            and hasattr(self.coordination_strategy, "value")
-            else self.coordination_strategy
+        return SimpleNamespace(
+            id=self.id,
+            name=self.name,
+            coordination_strategy=(
+                self.coordination_strategy.value
+                if self.coordination_strategy is not None
+                and hasattr(self.coordination_strategy, "value")
+                else self.coordination_strategy
+            ),
+            description=self.description,
+            agents=agents or {},
         )
-        team.description = self.description
-        team.agents = agents or {}
-        return team
 
 
 class MockAgentBuilder:
@@ -111,11 +196,7 @@ class MockAgentBuilder:
         return self
 
     def build(self):
-        agent = MagicMock()
-        agent.id = self.id
-        agent.name = self.name
-        agent.model = self.model
-        return agent
+        return SimpleNamespace(id=self.id, name=self.name, model=self.model)
 
 
 class MockTeamCoordinationStrategy:
@@ -131,7 +212,7 @@ class MockTeamMemberRole:
 
 
 # Mock the engine-core imports
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_team_enums():
     # Import enums directly from engine_core instead of using _get_team_enums
     try:
@@ -145,85 +226,92 @@ def mock_team_enums():
 
 @pytest.fixture
 def mock_team_builder():
-    with patch(
-        "engine_cli.commands.team.TeamBuilder", return_value=MockTeamBuilder()
+    with patch.object(
+        team_module, "TeamBuilder", return_value=MockTeamBuilder()
     ) as mock_builder:
         yield mock_builder
 
 
 @pytest.fixture
 def mock_agent_builder():
-    with patch(
-        "engine_cli.commands.team.AgentBuilder",
+    with patch.object(
+        team_module,
+        "AgentBuilder",
         return_value=MockAgentBuilder(),
         create=True,
     ) as mock_builder:
         yield mock_builder
 
 
-@pytest.fixture
+def _seed_team_storage(storage):
+    storage.list_teams.return_value = [dict(t) for t in _TEAMS]
+    storage.get_team.return_value = dict(_TEAM_1)
+    storage.delete_team.return_value = True
+    return storage
+
+
+@pytest.fixture(scope="session")
 def mock_team_storage():
-    """Mock TeamStorage class"""
-    mock_storage = MagicMock()
-    mock_storage.list_teams.return_value = [
-        {
-            "id": "test_team_1",
-            "name": "Test Team 1",
-            "coordination_strategy": "collaborative",
-            "agents": ["agent1", "agent2"],
-            "leader": "agent1",
-            "description": "A test team",
-            "created_at": "2024-01-01T00:00:00",
-        },
-        {
-            "id": "test_team_2",
-            "name": "Test Team 2",
-            "coordination_strategy": "hierarchical",
-            "agents": ["agent3"],
-            "leader": "agent3",
-            "description": "Another test team",
-        },
-    ]
-    mock_storage.get_team.return_value = {
-        "id": "test_team_1",
-        "name": "Test Team 1",
-        "coordination_strategy": "collaborative",
-        "agents": ["agent1", "agent2"],
-        "leader": "agent1",
-        "description": "A test team",
-        "created_at": "2024-01-01T00:00:00",
-    }
-    mock_storage.delete_team.return_value = True
-    return mock_storage
+    """Mock TeamStorage class, built once per session"""
+    return _seed_team_storage(MagicMock())
 
 
 @pytest.fixture
+def mock_team_storage_override(mock_team_storage):
+    """Session TeamStorage mock for tests that change its return values"""
+    mock_team_storage.reset_mock(return_value=True, side_effect=True)
+    yield _seed_team_storage(mock_team_storage)
+    mock_team_storage.reset_mock(return_value=True, side_effect=True)
+    _seed_team_storage(mock_team_storage)
+
+
+@pytest.fixture(autouse=True)
+def _install_team_storage(monkeypatch, mock_team_storage):
+    monkeypatch.setattr(team_module, "team_storage", mock_team_storage)
+
+
+# engine_core modules the team commands import, stubbed when not installed
+_ENGINE_CORE_MODULES = (
+    "engine_core",
+    "engine_core.core",
+    "engine_core.core.teams",
+    "engine_core.core.teams.team_builder",
+)
+
+
+@pytest.fixture(scope="module", autouse=True)
 def mock_imports():
-    """Mock all external imports"""
-    with patch.dict(
-        "sys.modules",
-        {
-            "engine_core": MagicMock(),
-            "engine_core.core": MagicMock(),
-            "engine_core.core.teams": MagicMock(),
-            "engine_core.core.teams.team_builder": MagicMock(),
-        },
-    ):
+    """Stub engine_core modules that fail to import, for this module only"""
+    with pytest.MonkeyPatch.context() as mp:
+        for name in _ENGINE_CORE_MODULES:
+            try:
+                importlib.import_module(name)
+            except Exception:
+                mp.setitem(sys.modules, name, MagicMock())
         yield
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cli_runner():
     return CliRunner()
 
 
 @pytest.fixture
-def temp_dir():
-    with tempfile.TemporaryDirectory() as tmpdir:
-        original_cwd = os.getcwd()
-        os.chdir(tmpdir)
-        yield tmpdir
-        os.chdir(original_cwd)
+def temp_dir(tmp_path, monkeypatch):
+    # Point os.getcwd at tmp_path instead of chdir-ing the whole process
+    monkeypatch.setattr(os, "getcwd", lambda: str(tmp_path))
+    return str(tmp_path)
+
+
+@pytest.fixture(scope="module")
+def corrupt_teams_dir(tmp_path_factory):
+    """cwd holding a teams/ dir with one corrupt and one valid file, written once"""
+    root = tmp_path_factory.mktemp("corrupt_teams")
+    teams_dir = root / "teams"
+    teams_dir.mkdir()
+    (teams_dir / "corrupt.yaml").write_text(_CORRUPT_YAML)
+    (teams_dir / "valid.yaml").write_text(_VALID_TEAM_YAML)
+    return str(root)
 
 
 class TestTeamStorage:
@@ -231,91 +319,66 @@ class TestTeamStorage:
 
     def test_list_teams(self, mock_team_storage):
         """Test listing teams"""
-        with patch("engine_cli.commands.team.team_storage", mock_team_storage):
-            from engine_cli.commands.team import team_storage
-
-            teams = team_storage.list_teams()
-            assert len(teams) == 2
-            assert teams[0]["name"] == "Test Team 1"
-            assert teams[1]["name"] == "Test Team 2"
+        teams = team_module.team_storage.list_teams()
+        assert len(teams) == 2
+        assert teams[0]["name"] == "Test Team 1"
+        assert teams[1]["name"] == "Test Team 2"
 
     def test_get_team(self, mock_team_storage):
         """Test getting a specific team"""
-        with patch("engine_cli.commands.team.team_storage", mock_team_storage):
-            from engine_cli.commands.team import team_storage
-
-            team = team_storage.get_team("test_team_1")
-            assert team is not None
-            assert team["id"] == "test_team_1"
-            assert team["name"] == "Test Team 1"
+        team = team_module.team_storage.get_team("test_team_1")
+        assert team is not None
+        assert team["id"] == "test_team_1"
+        assert team["name"] == "Test Team 1"
 
-    def test_get_team_not_found(self, mock_team_storage):
+    def test_get_team_not_found(self, mock_team_storage_override):
         """Test getting a non-existent team"""
-        mock_team_storage.get_team.return_value = None
-        with patch("engine_cli.commands.team.team_storage", mock_team_storage):
-            from engine_cli.commands.team import team_storage
-
-            team = team_storage.get_team("nonexistent")
-            assert team is None
+        mock_team_storage_override.get_team.return_value = None
+        team = team_module.team_storage.get_team("nonexistent")
+        assert team is None
 
     def test_delete_team(self, mock_team_storage):
         """Test deleting a team"""
-        with patch("engine_cli.commands.team.team_storage", mock_team_storage):
-            from engine_cli.commands.team import team_storage
-
-            result = team_storage.delete_team("test_team_1")
-            assert result is True
+        result = team_module.team_storage.delete_team("test_team_1")
+        assert result is True
 
-    def test_delete_team_not_found(self, mock_team_storage):
+    def test_delete_team_not_found(self, mock_team_storage_override):
         """Test deleting a non-existent team"""
-        mock_team_storage.delete_team.return_value = False
-        with patch("engine_cli.commands.team.team_storage", mock_team_storage):
-            from engine_cli.commands.team import team_storage
-
-            result = team_storage.delete_team("nonexistent")
-            assert result is False
+        mock_team_storage_override.delete_team.return_value = False
+        result = team_module.team_storage.delete_team("nonexistent")
+        assert result is False
 
+    @pytest.mark.fs
     def test_team_storage_initialization(self, temp_dir):
         """Test TeamStorage initialization creates directory"""
-        from engine_cli.commands.team import TeamStorage
-
         storage = TeamStorage()
         assert os.path.exists(storage.teams_dir)
         assert storage.teams_dir.endswith("teams")
 
-    def test_list_teams_with_corrupt_file(self, temp_dir):
-        """Test listing teams when a file is corrupted"""
-        from engine_cli.commands.team import TeamStorage
-
-        # Create a corrupted YAML file
-        teams_dir = os.path.join(os.getcwd(), "teams")
-        os.makedirs(teams_dir, exist_ok=True)
-
-        with open(os.path.join(teams_dir, "corrupt.yaml"), "w") as f:
-            f.write("invalid: yaml: content: [\n")
-
-        # Create a valid team file
-        with open(os.path.join(teams_dir, "valid.yaml"), "w") as f:
-            yaml.safe_dump({"id": "valid_team", "name": "Valid Team"}, f)
-
+    @pytest.mark.fs
+    @pytest.mark.parametrize("op", ["list", "get"])
+    def test_corrupt_yaml_handling(self, corrupt_teams_dir, monkeypatch, op):
+        """Test that corrupt team files are skipped or reported as missing"""
+        monkeypatch.setattr(os, "getcwd", lambda: corrupt_teams_dir)
         storage = TeamStorage()
-        teams = storage.list_teams()
 
-        # Should only return the valid team, corrupt file should be skipped
-        assert len(teams) == 1
-        assert teams[0]["id"] == "valid_team"
+        if op == "list":
+            # Should only return the valid team, corrupt file should be skipped
+            teams = storage.list_teams()
+            assert len(teams) == 1
+            assert teams[0]["id"] == "valid_team"
+        else:
+            assert storage.get_team("corrupt") is None
 
+    @pytest.mark.fs
     def test_get_team_file_handling(self, temp_dir):
         """Test get_team with file operations"""
-        from engine_cli.commands.team import TeamStorage
-
         teams_dir = os.path.join(os.getcwd(), "teams")
         os.makedirs(teams_dir, exist_ok=True)
 
         # Create a team file
-        team_data = {"id": "test_team", "name": "Test Team"}
         with open(os.path.join(teams_dir, "test_team.yaml"), "w") as f:
-            yaml.safe_dump(team_data, f)
+            f.write(_TEST_TEAM_YAML)
 
         storage = TeamStorage()
         team = storage.get_team("test_team")
@@ -324,26 +387,9 @@ class TestTeamStorage:
         assert team["id"] == "test_team"
         assert team["name"] == "Test Team"
 
-    def test_get_team_corrupt_file(self, temp_dir):
-        """Test get_team with corrupted file"""
-        from engine_cli.commands.team import TeamStorage
-
-        teams_dir = os.path.join(os.getcwd(), "teams")
-        os.makedirs(teams_dir, exist_ok=True)
-
-        # Create a corrupted file
-        with open(os.path.join(teams_dir, "corrupt.yaml"), "w") as f:
-            f.write("invalid: yaml: content: [\n")  # Truly invalid YAML
-
-        storage = TeamStorage()
-        team = storage.get_team("corrupt")
-
-        assert team is None
-
+    @pytest.mark.fs
     def test_delete_team_file_operation(self, temp_dir):
         """Test delete_team file operations"""
-        from engine_cli.commands.team import TeamStorage
-
         teams_dir = os.path.join(os.getcwd(), "teams")
         os.makedirs(teams_dir, exist_ok=True)
 
@@ -360,27 +406,18 @@ class TestTeamStorage:
 
     def test_get_team_file_read_error(self, temp_dir):
         """Test get_team when file read fails"""
-        from engine_cli.commands.team import TeamStorage
-
-        teams_dir = os.path.join(os.getcwd(), "teams")
-        os.makedirs(teams_dir, exist_ok=True)
-
-        # Create a file that will cause read error (simulate permission issue)
-        team_file = os.path.join(teams_dir, "error_team.yaml")
-        with open(team_file, "w") as f:
-            f.write("id: error_team\n")
-
         storage = TeamStorage()
 
-        # Mock open to raise exception
-        with patch("builtins.open", side_effect=OSError("Permission denied")):
+        # No file on disk: report it as present and fail the first open
+        with patch("os.path.exists", return_value=True), patch(
+            "builtins.open", side_effect=OSError("Permission denied")
+        ):
             team = storage.get_team("error_team")
             assert team is None
 
+    @pytest.mark.fs
     def test_delete_team_file_remove_error(self, temp_dir):
         """Test delete_team when file removal fails"""
-        from engine_cli.commands.team import TeamStorage
-
         teams_dir = os.path.join(os.getcwd(), "teams")
         os.makedirs(teams_dir, exist_ok=True)
 
@@ -400,469 +437,140 @@ class TestTeamStorage:
 class TestTeamCLICommands:
     """Test CLI commands for team management"""
 
-    def test_create_team_basic(
-        self,
-        cli_runner,
-        mock_team_enums,
-        mock_team_builder,
-        mock_agent_builder,
-        mock_imports,
-    ):
-        """Test creating a basic team"""
-        with patch("engine_cli.commands.team.success"), patch(
-            "engine_cli.commands.team.table"
-        ), patch("engine_cli.commands.team.print_table"), patch(
-            "builtins.open", mock_open()
-        ) as mock_file, patch(
-            "os.makedirs"
-        ), patch(
-            "yaml.safe_dump"
-        ):
-
-            from engine_cli.commands.team import create
-
-            result = cli_runner.invoke(
-                create,
-                [
-                    "test_team",
-                    "--agents",
-                    "agent1,agent2",
-                    "--strategy",
-                    "collaborative",
-                    "--description",
-                    "A test team",
-                    "--save",
-                ],
-            )
-
-            assert result.exit_code == 0
-
-    def test_create_team_hierarchical(
-        self,
-        cli_runner,
-        mock_team_enums,
-        mock_team_builder,
-        mock_agent_builder,
-        mock_imports,
-    ):
-        """Test creating a hierarchical team with leader"""
-        with patch("engine_cli.commands.team.success"), patch(
-            "engine_cli.commands.team.table"
-        ), patch("engine_cli.commands.team.print_table"), patch(
-            "builtins.open", mock_open()
-        ) as mock_file, patch(
-            "os.makedirs"
-        ), patch(
-            "yaml.safe_dump"
-        ):
-
-            from engine_cli.commands.team import create
-
-            result = cli_runner.invoke(
-                create,
-                [
-                    "hierarchical_team",
-                    "--agents",
-                    "agent1,agent2,agent3",
-                    "--leader",
-                    "agent1",
-                    "--strategy",
-                    "hierarchical",
-                    "--description",
-                    "Hierarchical team",
-                    "--save",
-                ],
-            )
-
-            assert result.exit_code == 0
-
-    def test_create_team_different_strategies(
-        self,
-        cli_runner,
-        mock_team_enums,
-        mock_team_builder,
-        mock_agent_builder,
-        mock_imports,
-    ):
-        """Test creating teams with different coordination strategies"""
-        with patch("engine_cli.commands.team.success"), patch(
-            "engine_cli.commands.team.table"
-        ), patch("engine_cli.commands.team.print_table"):
-
-            from engine_cli.commands.team import create
-
-            # Test parallel strategy
-            result = cli_runner.invoke(
-                create,
-                [
-                    "parallel_team",
-                    "--agents",
-                    "agent1,agent2",
-                    "--strategy",
-                    "parallel",
-                ],
-            )
-            assert result.exit_code == 0
-
-            # Test sequential strategy
-            result = cli_runner.invoke(
-                create,
-                [
-                    "sequential_team",
-                    "--agents",
-                    "agent1,agent2",
-                    "--strategy",
-                    "sequential",
-                ],
-            )
-            assert result.exit_code == 0
-
-    def test_create_team_no_agents(
-        self, cli_runner, mock_team_enums, mock_team_builder, mock_imports
-    ):
-        """Test creating a team without agents"""
-        with patch("engine_cli.commands.team.success"), patch(
-            "engine_cli.commands.team.table"
-        ), patch("engine_cli.commands.team.print_table"):
-
-            from engine_cli.commands.team import create
-
-            result = cli_runner.invoke(
-                create,
-                [
-                    "empty_team",
-                    "--strategy",
-                    "collaborative",
-                    "--description",
-                    "Team without agents",
-                ],
-            )
-
-            assert result.exit_code == 0
-
-    def test_create_team_with_output_file(
-        self,
-        cli_runner,
-        mock_team_enums,
-        mock_team_builder,
-        mock_agent_builder,
-        mock_imports,
-        temp_dir,
-    ):
-        """Test creating a team with output file"""
-        with patch("engine_cli.commands.team.success"), patch(
-            "engine_cli.commands.team.table"
-        ), patch("engine_cli.commands.team.print_table"), patch(
-            "builtins.open", mock_open()
-        ) as mock_file, patch(
-            "os.makedirs"
-        ), patch(
+    @pytest.fixture(autouse=True)
+    def _patch_ui(self):
+        with ExitStack() as stack:
+            for name in ("success", "table", "print_table", "error", "key_value"):
+                stack.enter_context(patch.object(team_module, name))
+            yield
+
+    @pytest.fixture
+    def save_io(self, request):
+        """Patch file I/O for create cases that save; param is open() patch kwargs"""
+        if request.param is None:
+            yield
+            return
+        with patch("builtins.open", **request.param), patch("os.makedirs"), patch(
             "yaml.safe_dump"
         ):
-
-            from engine_cli.commands.team import create
-
-            result = cli_runner.invoke(
-                create,
-                [
-                    "output_team",
-                    "--agents",
-                    "agent1,agent2",
-                    "--output",
-                    "custom_output.yaml",
-                ],
-            )
-
-            assert result.exit_code == 0
-
-    def test_create_team_save_error(
-        self,
-        cli_runner,
-        mock_team_enums,
-        mock_team_builder,
-        mock_agent_builder,
-        mock_imports,
-    ):
-        """Test create team when save fails"""
-        with patch("engine_cli.commands.team.success"), patch(
-            "engine_cli.commands.team.table"
-        ), patch("engine_cli.commands.team.print_table"), patch(
-            "builtins.open", side_effect=OSError("Permission denied")
-        ), patch(
-            "os.makedirs"
-        ):
-
-            from engine_cli.commands.team import create
-
-            result = cli_runner.invoke(
-                create, ["failing_team", "--agents", "agent1", "--save"]
-            )
-
-            assert result.exit_code == 0
+            yield
+
+    @pytest.mark.parametrize(
+        "argv, save_io",
+        [
+            pytest.param(_ARGV_BASIC, {"new_callable": mock_open}, id="basic"),
+            pytest.param(
+                _ARGV_HIERARCHICAL, {"new_callable": mock_open}, id="hierarchical"
+            ),
+            pytest.param(_ARGV_PARALLEL_STRATEGY, None, id="parallel_strategy"),
+            pytest.param(_ARGV_SEQUENTIAL_STRATEGY, None, id="sequential_strategy"),
+            pytest.param(_ARGV_NO_AGENTS, None, id="no_agents"),
+            pytest.param(
+                _ARGV_WITH_OUTPUT_FILE,
+                {"new_callable": mock_open},
+                id="with_output_file",
+            ),
             # Should still succeed in creating team, just fail to save
-
-    def test_create_team_agent_creation_logic(
+            pytest.param(
+                _ARGV_SAVE_ERROR,
+                {"side_effect": OSError("Permission denied")},
+                id="save_error",
+            ),
+            pytest.param(_ARGV_AGENT_CREATION_LOGIC, None, id="agent_creation_logic"),
+            pytest.param(_ARGV_EMPTY_AGENT_LIST, None, id="empty_agent_list"),
+            pytest.param(_ARGV_WITH_LEADER, None, id="with_leader"),
+            pytest.param(_ARGV_WHITESPACE_IN_AGENTS, None, id="whitespace_in_agents"),
+        ],
+        indirect=["save_io"],
+    )
+    def test_create_team(
         self,
         cli_runner,
         mock_team_enums,
         mock_team_builder,
         mock_agent_builder,
-        mock_imports,
+        save_io,
+        argv,
     ):
-        """Test the agent creation logic in create command"""
-        with patch("engine_cli.commands.team.success"), patch(
-            "engine_cli.commands.team.table"
-        ), patch("engine_cli.commands.team.print_table"):
-
-            from engine_cli.commands.team import create
-
-            result = cli_runner.invoke(
-                create,
-                [
-                    "agent_test_team",
-                    "--agents",
-                    "agent1, agent2 , agent3",  # Test whitespace handling
-                    "--strategy",
-                    "parallel",
-                ],
-            )
-
-            assert result.exit_code == 0
-
-    def test_create_team_empty_agent_list(
-        self, cli_runner, mock_team_enums, mock_team_builder, mock_imports
-    ):
-        """Test creating team with empty agent string"""
-        with patch("engine_cli.commands.team.success"), patch(
-            "engine_cli.commands.team.table"
-        ), patch("engine_cli.commands.team.print_table"):
-
-            from engine_cli.commands.team import create
-
-            result = cli_runner.invoke(
-                create,
-                [
-                    "empty_agents_team",
-                    "--agents",
-                    "",  # Empty agent list
-                    "--strategy",
-                    "collaborative",
-                ],
-            )
-
-            assert result.exit_code == 0
-
-    def test_create_team_with_leader(
-        self,
-        cli_runner,
-        mock_team_enums,
-        mock_team_builder,
-        mock_agent_builder,
-        mock_imports,
-    ):
-        """Test creating team with leader specified"""
-        with patch("engine_cli.commands.team.success"), patch(
-            "engine_cli.commands.team.table"
-        ), patch("engine_cli.commands.team.print_table"):
-
-            from engine_cli.commands.team import create
-
-            result = cli_runner.invoke(
-                create,
-                [
-                    "leader_team",
-                    "--agents",
-                    "agent1,agent2,agent3",
-                    "--leader",
-                    "agent1",
-                    "--strategy",
-                    "hierarchical",
-                ],
-            )
-
-            assert result.exit_code == 0
-
-    def test_create_team_with_whitespace_in_agents(
-        self,
-        cli_runner,
-        mock_team_enums,
-        mock_team_builder,
-        mock_agent_builder,
-        mock_imports,
-    ):
-        """Test create team with whitespace around agent names"""
-        with patch("engine_cli.commands.team.success"), patch(
-            "engine_cli.commands.team.table"
-        ), patch("engine_cli.commands.team.print_table"):
-
-            from engine_cli.commands.team import create
-
-            result = cli_runner.invoke(
-                create,
-                [
-                    "whitespace_team",
-                    "--agents",
-                    "  agent1  ,  agent2  , agent3 ",
-                    "--strategy",
-                    "parallel",
-                ],
-            )
-
-            assert result.exit_code == 0
-
-    def test_list_teams_table_format(self, cli_runner, mock_team_storage):
-        """Test listing teams in table format"""
-        with patch("engine_cli.commands.team.team_storage", mock_team_storage), patch(
-            "engine_cli.commands.team.table"
-        ), patch("engine_cli.commands.team.print_table"), patch(
-            "engine_cli.commands.team.success"
-        ):
-
-            from engine_cli.commands.team import list
-
-            result = cli_runner.invoke(list, ["--format", "table"])
-
-            assert result.exit_code == 0
-
-    def test_list_teams_json_format(self, cli_runner, mock_team_storage):
-        """Test listing teams in JSON format"""
-        with patch("engine_cli.commands.team.team_storage", mock_team_storage):
-            from engine_cli.commands.team import list
-
-            result = cli_runner.invoke(list, ["--format", "json"])
+        """Test creating teams across strategies, agent lists and save paths"""
+        result = cli_runner.invoke(create, list(argv), catch_exceptions=False)
 
-            assert result.exit_code == 0
-            # Should contain JSON output
-            assert "test_team_1" in result.output
-
-    def test_list_teams_yaml_format(self, cli_runner, mock_team_storage):
-        """Test listing teams in YAML format"""
-        with patch("engine_cli.commands.team.team_storage", mock_team_storage):
-            from engine_cli.commands.team import list
+        assert result.exit_code == 0
 
-            result = cli_runner.invoke(list, ["--format", "yaml"])
+    @pytest.mark.parametrize("fmt", ["table", "json", "yaml"])
+    def test_list_teams_format(self, cli_runner, mock_team_storage, fmt):
+        """Test listing teams in each output format"""
+        result = cli_runner.invoke(list_cmd, ["--format", fmt])
 
-            assert result.exit_code == 0
-            # Should contain YAML output
+        assert result.exit_code == 0
+        if fmt != "table":
             assert "test_team_1" in result.output
 
-    def test_list_teams_empty(self, cli_runner):
+    def test_list_teams_empty(self, cli_runner, mock_team_storage_override):
         """Test listing teams when none exist"""
-        mock_empty_storage = MagicMock()
-        mock_empty_storage.list_teams.return_value = []
-
-        with patch("engine_cli.commands.team.team_storage", mock_empty_storage):
-            from engine_cli.commands.team import list
-
-            result = cli_runner.invoke(list)
-
-            assert result.exit_code == 0
-            assert "No teams found" in result.output
-
-    def test_show_team_table_format(self, cli_runner, mock_team_storage):
-        """Test showing team details in table format"""
-        with patch("engine_cli.commands.team.team_storage", mock_team_storage), patch(
-            "engine_cli.commands.team.key_value"
-        ):
-
-            from engine_cli.commands.team import show
+        mock_team_storage_override.list_teams.return_value = []
 
-            result = cli_runner.invoke(show, ["test_team_1", "--format", "table"])
+        result = cli_runner.invoke(list_cmd)
 
-            assert result.exit_code == 0
+        assert result.exit_code == 0
+        assert "No teams found" in result.output
 
-    def test_show_team_json_format(self, cli_runner, mock_team_storage):
-        """Test showing team details in JSON format"""
-        with patch("engine_cli.commands.team.team_storage", mock_team_storage):
-            from engine_cli.commands.team import show
+    @pytest.mark.parametrize("fmt", ["table", "json", "yaml"])
+    def test_show_team_format(self, cli_runner, mock_team_storage, fmt):
+        """Test showing team details in each output format"""
+        result = cli_runner.invoke(show, ["test_team_1", "--format", fmt])
 
-            result = cli_runner.invoke(show, ["test_team_1", "--format", "json"])
-
-            assert result.exit_code == 0
+        assert result.exit_code == 0
+        if fmt != "table":
             assert "test_team_1" in result.output
 
-    def test_show_team_yaml_format(self, cli_runner, mock_team_storage):
-        """Test showing team details in YAML format"""
-        with patch("engine_cli.commands.team.team_storage", mock_team_storage):
-            from engine_cli.commands.team import show
-
-            result = cli_runner.invoke(show, ["test_team_1", "--format", "yaml"])
-
-            assert result.exit_code == 0
-            assert "test_team_1" in result.output
-
-    def test_show_team_not_found(self, cli_runner):
+    def test_show_team_not_found(self, cli_runner, mock_team_storage_override):
         """Test showing a non-existent team"""
-        mock_empty_storage = MagicMock()
-        mock_empty_storage.get_team.return_value = None
-
-        with patch("engine_cli.commands.team.team_storage", mock_empty_storage), patch(
-            "engine_cli.commands.team.error"
-        ):
-
-            from engine_cli.commands.team import show
-
-            result = cli_runner.invoke(show, ["nonexistent"])
-
-            assert result.exit_code == 0
-
-    def test_delete_team_success(self, cli_runner, mock_team_storage):
-        """Test deleting a team successfully"""
-        with patch("engine_cli.commands.team.team_storage", mock_team_storage), patch(
-            "engine_cli.commands.team.success"
-        ):
-
-            from engine_cli.commands.team import delete
-
-            result = cli_runner.invoke(delete, ["test_team_1", "--force"])
-
-            assert result.exit_code == 0
-
-    def test_delete_team_not_found(self, cli_runner):
-        """Test deleting a non-existent team"""
-        mock_empty_storage = MagicMock()
-        mock_empty_storage.get_team.return_value = None
-
-        with patch("engine_cli.commands.team.team_storage", mock_empty_storage), patch(
-            "engine_cli.commands.team.error"
-        ):
-
-            from engine_cli.commands.team import delete
-
-            result = cli_runner.invoke(delete, ["nonexistent", "--force"])
-
-            assert result.exit_code == 0
-
-    def test_delete_team_with_confirmation(self, cli_runner, mock_team_storage):
-        """Test deleting a team with user confirmation"""
-        with patch("engine_cli.commands.team.team_storage", mock_team_storage), patch(
-            "engine_cli.commands.team.success"
-        ), patch("click.confirm", return_value=True):
-
-            from engine_cli.commands.team import delete
-
-            result = cli_runner.invoke(delete, ["test_team_1"])
-
-            assert result.exit_code == 0
+        mock_team_storage_override.get_team.return_value = None
+
+        result = cli_runner.invoke(show, ["nonexistent"], catch_exceptions=False)
+
+        assert result.exit_code == 0
+
+    @pytest.mark.parametrize(
+        "exists,force,confirm",
+        [
+            pytest.param(True, True, None, id="success"),
+            pytest.param(False, True, None, id="not_found"),
+            pytest.param(True, False, True, id="with_confirmation"),
+        ],
+    )
+    def test_delete_team_variants(
+        self, cli_runner, mock_team_storage_override, exists, force, confirm
+    ):
+        """Test deleting a team with and without --force or an existing team"""
+        if not exists:
+            mock_team_storage_override.get_team.return_value = None
+        args = ["test_team_1"] + (["--force"] if force else [])
+        ctx = nullcontext() if force else patch("click.confirm", return_value=confirm)
+
+        with ctx:
+            result = cli_runner.invoke(delete, args, catch_exceptions=False)
+
+        assert result.exit_code == 0
+        if not force:
+            mock_team_storage_override.delete_team.assert_called_once_with(
+                "test_team_1"
+            )
 
-    def test_list_teams_error_handling(self, cli_runner):
+    def test_list_teams_error_handling(self, cli_runner, mock_team_storage_override):
         """Test list teams with error handling"""
-        mock_error_storage = MagicMock()
-        mock_error_storage.list_teams.side_effect = Exception("Storage error")
+        mock_team_storage_override.list_teams.side_effect = Exception("Storage error")
 
-        with patch("engine_cli.commands.team.team_storage", mock_error_storage), patch(
-            "engine_cli.commands.team.error"
-        ):
-
-            from engine_cli.commands.team import list
+        result = cli_runner.invoke(list_cmd, catch_exceptions=False)
 
-            result = cli_runner.invoke(list)
+        assert result.exit_code == 0
 
-            assert result.exit_code == 0
-
-    def test_list_teams_with_long_description(self, cli_runner, mock_team_storage):
+    def test_list_teams_with_long_description(
+        self, cli_runner, mock_team_storage_override
+    ):
         """Test list teams with long description truncation"""
-        mock_team_storage.list_teams.return_value = [
+        mock_team_storage_override.list_teams.return_value = [
             {
                 "id": "long_desc_team",
                 "name": "Long Desc Team",
@@ -875,36 +583,21 @@ class TestTeamCLICommands:
             }
         ]
 
-        with patch("engine_cli.commands.team.team_storage", mock_team_storage), patch(
-            "engine_cli.commands.team.table"
-        ), patch("engine_cli.commands.team.print_table"), patch(
-            "engine_cli.commands.team.success"
-        ):
-
-            from engine_cli.commands.team import list
-
-            result = cli_runner.invoke(list)
+        result = cli_runner.invoke(list_cmd, catch_exceptions=False)
 
-            assert result.exit_code == 0
+        assert result.exit_code == 0
 
-    def test_show_team_error_handling(self, cli_runner):
+    def test_show_team_error_handling(self, cli_runner, mock_team_storage_override):
         """Test show team with error handling"""
-        mock_error_storage = MagicMock()
-        mock_error_storage.get_team.side_effect = Exception("Storage error")
+        mock_team_storage_override.get_team.side_effect = Exception("Storage error")
 
-        with patch("engine_cli.commands.team.team_storage", mock_error_storage), patch(
-            "engine_cli.commands.team.error"
-        ):
-
-            from engine_cli.commands.team import show
+        result = cli_runner.invoke(show, ["error_team"], catch_exceptions=False)
 
-            result = cli_runner.invoke(show, ["error_team"])
+        assert result.exit_code == 0
 
-            assert result.exit_code == 0
-
-    def test_show_team_with_all_fields(self, cli_runner, mock_team_storage):
+    def test_show_team_with_all_fields(self, cli_runner, mock_team_storage_override):
         """Test show team with all optional fields present"""
-        mock_team_storage.get_team.return_value = {
+        mock_team_storage_override.get_team.return_value = {
             "id": "complete_team",
             "name": "Complete Team",
             "coordination_strategy": "hierarchical",
@@ -914,63 +607,48 @@ class TestTeamCLICommands:
             "created_at": "2024-01-01T12:00:00",
         }
 
-        with patch("engine_cli.commands.team.team_storage", mock_team_storage), patch(
-            "engine_cli.commands.team.key_value"
-        ):
+        result = cli_runner.invoke(show, ["complete_team"], catch_exceptions=False)
 
-            from engine_cli.commands.team import show
+        assert result.exit_code == 0
 
-            result = cli_runner.invoke(show, ["complete_team"])
-
-            assert result.exit_code == 0
-
-    def test_delete_team_error_handling(self, cli_runner, mock_team_storage):
+    def test_delete_team_error_handling(self, cli_runner, mock_team_storage_override):
         """Test delete team with error handling"""
-        mock_team_storage.get_team.return_value = {"id": "error_team"}
-        mock_team_storage.delete_team.side_effect = Exception("Delete error")
-
-        with patch("engine_cli.commands.team.team_storage", mock_team_storage), patch(
-            "engine_cli.commands.team.error"
-        ):
-
-            from engine_cli.commands.team import delete
-
-            result = cli_runner.invoke(delete, ["error_team", "--force"])
-
-            assert result.exit_code == 0
+        mock_team_storage_override.get_team.return_value = {"id": "error_team"}
+        mock_team_storage_override.delete_team.side_effect = Exception("Delete error")
 
-    def test_delete_team_confirmation_prompt(self, cli_runner, mock_team_storage):
-        """Test delete team confirmation prompt behavior"""
-        with patch("engine_cli.commands.team.team_storage", mock_team_storage), patch(
-            "click.confirm", return_value=True
-        ), patch("engine_cli.commands.team.success"):
+        result = cli_runner.invoke(
+            delete, ["error_team", "--force"], catch_exceptions=False
+        )
 
-            from engine_cli.commands.team import delete
+        assert result.exit_code == 0
 
-            result = cli_runner.invoke(delete, ["test_team_1"])
 
-            assert result.exit_code == 0
-            # Should prompt for confirmation when --force is not used
+@pytest.fixture(scope="module")
+def team_enums(mock_imports):
+    """Team enums exported by the real engine_core; skips on stubs or old releases"""
+    module = pytest.importorskip("engine_core")
+    if isinstance(module, MagicMock):
+        pytest.skip("engine_core is stubbed")
+    enums = []
+    for name in ("TeamCoordinationStrategy", "TeamMemberRole"):
+        enum_cls = getattr(module, name, None)
+        if enum_cls is None:
+            pytest.skip(f"engine_core does not export {name}")
+        enums.append(enum_cls)
+    return tuple(enums)
 
 
 class TestTeamUtilityFunctions:
     """Test utility functions"""
 
-    def test_team_enums_import(self):
+    def test_team_enums_import(self, team_enums):
         """Test that team enums can be imported from engine_core"""
-        try:
-            from engine_core import TeamCoordinationStrategy  # type: ignore
-            from engine_core import TeamMemberRole  # type: ignore; type: ignore
-
-            assert TeamCoordinationStrategy is not None
-            assert TeamMemberRole is not None
-        except ImportError:
-            pytest.skip("engine_core not available")
+        for enum_cls in team_enums:
+            assert issubclass(enum_cls, Enum)
+            assert list(enum_cls)
 
     def test_get_team_storage(self):
         """Test getting team storage instance"""
-        from engine_cli.commands.team import get_team_storage
-
         storage = get_team_storage()
         assert storage is not None
 
@@ -1,60 +1,48 @@
 """Tests for workflow.py module."""
 
-import json
+import importlib.util
 import os
 import sys
-import tempfile
-from unittest.mock import MagicMock, mock_open, patch
+from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch, sentinel
 
-try:
-    import pytest  # type: ignore
-
-    PYTEST_AVAILABLE = True
-except ImportError:
-    PYTEST_AVAILABLE = False
-
-    class MockMark:
-        def asyncio(self, func=None):
-            """Mock asyncio marker that can be used as decorator"""
-            if func is None:
-                # Called as @pytest.mark.asyncio()
-                return lambda f: f
-            else:
-                # Called as @pytest.mark.asyncio
-                return func
-
-    class MockPytest:
-        def __init__(self):
-            self.mark = MockMark()
-            self.fixture = lambda f: f
+import click
+import pytest
+import yaml
+from click.testing import CliRunner
+from yaml.representer import SafeRepresenter
 
-        def raises(self, *args, **kwargs):
-            # Mock implementation
-            class MockContext:
-                def __enter__(self):
-                    return self
+# LibYAML-backed dumper/loader when PyYAML was built with it
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-                def __exit__(self, exc_type, exc_val, exc_tb):
-                    return None
+# orjson builds the --input-data payloads faster when installed. Both paths
+# emit non-ASCII characters as-is, so payloads match whichever is used.
+try:
+    import orjson  # type: ignore
 
-            return MockContext()
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
 
-        def skip(self, reason):
-            raise Exception(f"Skipped: {reason}")
+except ImportError:
+    import json
 
-        @staticmethod
-        def main(args):
-            pass
+    def _json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False)
 
-    pytest = MockPytest()
 
-import yaml
-from click.testing import CliRunner
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+# Add src to path for imports, once even if the module is collected again
+_SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+if _SRC_PATH not in sys.path:
+    sys.path.insert(0, _SRC_PATH)
 
 try:
+    # Cheap spec lookup first so a missing package skips the heavy import
+    if importlib.util.find_spec("engine_cli.commands.workflow") is None:
+        raise ImportError("engine_cli.commands.workflow not found")
+    import engine_cli.commands.workflow as workflow_module
     from engine_cli.commands.workflow import CLIWorkflowBuilder  # type: ignore
     from engine_cli.commands.workflow import WorkflowResolver  # type: ignore
     from engine_cli.commands.workflow import WorkflowStorage  # type: ignore
@@ -63,87 +51,49 @@ try:
         cli,
         get_workflow_storage,
     )
-except ImportError:
-    # Fallback for test environment - create mock classes
-    class WorkflowStorage:
-        def __init__(self):
-            self.workflows_dir = os.path.join(os.getcwd(), "workflows")
-            os.makedirs(self.workflows_dir, exist_ok=True)
-
-        def list_workflows(self):
-            return []
-
-        def save_workflow(self, workflow):
-            return True
-
-        def load_workflow(self, workflow_id):
-            return None
 
-        def delete_workflow(self, workflow_id):
-            return False
-
-    class WorkflowResolver:
-        def __init__(self):
-            self.agent_storage = None
-            self.team_storage = None
-
-        def resolve_workflow(self, workflow_data):
-            return None
-
-        def _get_agent_storage(self):
-            return None
+    _REAL_CLI = True
+except ImportError:
+    # Fallback for test environment - stand-ins live in _workflow_fallback
+    from _workflow_fallback import (  # type: ignore
+        CLIWorkflowBuilder,
+        WorkflowResolver,
+        WorkflowStorage,
+    )
 
-        def _get_team_storage(self):
-            return None
+    _REAL_CLI = False
+    workflow_module = None
+    cli = MagicMock()
+    get_workflow_storage = MagicMock(return_value=WorkflowStorage())
+    _get_workflow_execution_service = MagicMock(return_value=MagicMock())
+    _get_workflow_enums = MagicMock(return_value=MagicMock())
 
-    class CLIWorkflowBuilder:
-        def __init__(self):
-            self.agent_specs = []
-            self.team_specs = []
-            self.edge_specs = []
 
-        def with_id(self, workflow_id):
-            return self
+def _write_workflow(name, data):
+    """Write data as workflows/<name>.yaml under the cwd in one call."""
+    Path("workflows", f"{name}.yaml").write_text(yaml.dump(data, Dumper=_YAML_DUMPER))
 
-        def add_agent_vertex(self, vertex_id, agent_id, instruction):
-            self.agent_specs.append(
-                {
-                    "vertex_id": vertex_id,
-                    "agent_id": agent_id,
-                    "instruction": instruction,
-                }
-            )
-            return self
 
-        def add_edge(self, from_vertex, to_vertex):
-            self.edge_specs.append({"from": from_vertex, "to": to_vertex})
-            return self
+class _WorkflowConfig(dict):
+    """Workflow config: a mapping that also carries description and version."""
 
-    cli = MagicMock()
-    get_workflow_storage = MagicMock(return_value=WorkflowStorage())
-    _get_workflow_execution_service = MagicMock(return_value=MagicMock())
-    _get_workflow_enums = MagicMock(return_value=MagicMock())
+    description = "Test description"
+    version = "2.0.0"
 
 
+@pytest.mark.fs
 class TestWorkflowStorage:
     """Test WorkflowStorage class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-        os.chdir(self.temp_dir)
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        os.chdir(self.original_cwd)
-        # Clean up temp directory
-        import shutil
-
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @pytest.fixture(autouse=True)
+    def workflow_dir(self, tmp_path, monkeypatch):
+        """Run each test from its own tmp_path with an empty workflows/ dir."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "workflows").mkdir()
 
     def test_init_creates_workflows_dir(self):
         """Test that WorkflowStorage creates workflows directory."""
+        os.rmdir("workflows")
         storage = WorkflowStorage()
         assert storage is not None
         assert os.path.exists("workflows")
@@ -170,47 +120,64 @@ class TestWorkflowStorage:
             "created_at": "2024-01-01T00:00:00",
         }
 
-        workflow_path = os.path.join("workflows", "test_workflow.yaml")
-        with open(workflow_path, "w") as f:
-            yaml.safe_dump(workflow_data, f)
+        _write_workflow("test_workflow", workflow_data)
 
         workflows = storage.list_workflows()
         assert len(workflows) == 1
         assert workflows[0]["id"] == "test_workflow"
         assert workflows[0]["name"] == "Test Workflow"
 
-    @patch("yaml.safe_dump")
-    @patch("builtins.open", new_callable=mock_open)
-    def test_save_workflow_with_builder(self, mock_file, mock_yaml_dump):
+    def test_save_workflow_with_builder(self, monkeypatch):
         """Test saving a workflow with CLIWorkflowBuilder."""
         storage = WorkflowStorage()
+        # Let the safe dumper write the config mapping as a plain dict
+        monkeypatch.setitem(
+            SafeRepresenter.yaml_representers,
+            _WorkflowConfig,
+            SafeRepresenter.represent_dict,
+        )
 
-        # Mock workflow
-        mock_workflow = MagicMock()
+        mock_workflow = Mock(spec_set=_WORKFLOW_ATTRS)
         mock_workflow.id = "test_workflow"
         mock_workflow.name = "Test Workflow"
         mock_workflow.vertex_count = 2
         mock_workflow.edge_count = 1
-        mock_workflow.created_at = MagicMock()
-        mock_workflow.created_at.isoformat.return_value = "2024-01-01T00:00:00"
-        mock_workflow.config = MagicMock()
-        mock_workflow.config.description = "Test description"
-        mock_workflow.config.version = "1.0.0"
-
-        # Mock builder with agent specs
-        mock_builder = MagicMock()
-        mock_builder.agent_specs = [
+        mock_workflow.created_at = datetime(2024, 1, 1)
+        mock_workflow.config = _WorkflowConfig(retries=3)
+
+        # Builder with agent specs
+        mock_builder = SimpleNamespace(
+            agent_specs=[
+                {
+                    "vertex_id": "agent1",
+                    "agent_id": "test_agent",
+                    "instruction": "Process data",
+                }
+            ],
+            team_specs=[],
+            edge_specs=[{"from": "agent1", "to": "agent2"}],
+        )
+
+        result = storage.save_workflow(mock_workflow, mock_builder)
+        assert result is True
+
+        saved = yaml.load(
+            Path("workflows", "test_workflow.yaml").read_text(), Loader=_YAML_LOADER
+        )
+        assert saved["id"] == "test_workflow"
+        assert saved["name"] == "Test Workflow"
+        assert saved["description"] == "Test description"
+        assert saved["version"] == "2.0.0"
+        assert saved["config"] == {"retries": 3}
+        assert saved["vertices"] == [
             {
-                "vertex_id": "agent1",
+                "id": "agent1",
+                "type": "agent",
                 "agent_id": "test_agent",
                 "instruction": "Process data",
             }
         ]
-        mock_builder.team_specs = []
-        mock_builder.edge_specs = [{"from": "agent1", "to": "agent2"}]
-
-        result = storage.save_workflow(mock_workflow)
-        assert result is True
+        assert saved["edges"] == [{"from": "agent1", "to": "agent2"}]
 
     def test_load_workflow_success(self):
         """Test loading a workflow successfully."""
@@ -227,9 +194,7 @@ class TestWorkflowStorage:
             "created_at": "2024-01-01T00:00:00",
         }
 
-        workflow_path = os.path.join("workflows", "load_test.yaml")
-        with open(workflow_path, "w") as f:
-            yaml.safe_dump(workflow_data, f)
+        _write_workflow("load_test", workflow_data)
 
         loaded_data = storage.load_workflow("load_test")
         assert loaded_data is not None
@@ -248,16 +213,24 @@ class TestWorkflowStorage:
         storage = WorkflowStorage()
 
         # Create test workflow file
-        workflow_path = os.path.join("workflows", "delete_test.yaml")
-        with open(workflow_path, "w") as f:
-            yaml.safe_dump({"id": "delete_test"}, f)
+        _write_workflow("delete_test", {"id": "delete_test"})
+        workflow_path = Path("workflows", "delete_test.yaml")
 
         # Verify file exists
-        assert os.path.exists(workflow_path)
+        assert workflow_path.exists()
 
         result = storage.delete_workflow("delete_test")
         assert result is True
-        assert not os.path.exists(workflow_path)
+        assert not workflow_path.exists()
+
+    def test_load_workflow_from_disk(self):
+        """Test a list/load round trip through the os and open calls."""
+        storage = WorkflowStorage()
+
+        _write_workflow("disk_test", {"id": "disk_test", "name": "Disk"})
+
+        assert [w["id"] for w in storage.list_workflows()] == ["disk_test"]
+        assert storage.load_workflow("disk_test")["name"] == "Disk"
 
     def test_delete_workflow_not_found(self):
         """Test deleting a non-existent workflow."""
@@ -267,83 +240,49 @@ class TestWorkflowStorage:
         assert result is False
 
 
-class TestWorkflowResolver:
-    """Test WorkflowResolver class."""
-
-    def test_init(self):
-        """Test WorkflowResolver initialization."""
-        resolver = WorkflowResolver()
-        assert resolver.agent_storage is None
-        assert resolver.team_storage is None
-
-    @patch("engine_cli.commands.workflow.WorkflowBuilder")
-    def test_resolve_workflow_basic(self, mock_builder_class):
-        """Test basic workflow resolution."""
-        resolver = WorkflowResolver()
-
-        # Mock builder
-        mock_builder = MagicMock()
-        mock_builder.with_id.return_value = mock_builder
-        mock_builder.with_name.return_value = mock_builder
-        mock_builder.add_function_vertex.return_value = mock_builder
-        mock_builder.build.return_value = MagicMock()
-        mock_builder_class.return_value = mock_builder
-
-        workflow_data = {
+# Attributes the CLI reads from a built workflow
+_WORKFLOW_ATTRS = (
+    "id",
+    "name",
+    "vertex_count",
+    "edge_count",
+    "created_at",
+    "config",
+    "state",
+)
+
+_CHAINED_BUILDER_METHODS = (
+    "with_id",
+    "with_name",
+    "with_description",
+    "with_version",
+    "add_function_vertex",
+    "add_agent_vertex",
+)
+
+
+@pytest.fixture
+def mock_builder():
+    """Fluent builder mock: chain methods return itself, build() a workflow Mock."""
+    builder = Mock(spec_set=_CHAINED_BUILDER_METHODS + ("build",))
+    for name in _CHAINED_BUILDER_METHODS:
+        getattr(builder, name).return_value = builder
+    builder.build.return_value = Mock(spec_set=_WORKFLOW_ATTRS)
+    return builder
+
+
+_RESOLVE_CASES = [
+    pytest.param(
+        {
             "id": "test_workflow",
             "name": "Test Workflow",
             "vertex_count": 1,
             "config": {},
-        }
-
-        result = resolver.resolve_workflow(workflow_data)
-
-        assert result is not None
-        mock_builder_class.assert_called_once()
-        mock_builder.with_id.assert_called_once_with("test_workflow")
-        mock_builder.with_name.assert_called_once_with("Test Workflow")
-        mock_builder.add_function_vertex.assert_called_once()
-        mock_builder.build.assert_called_once()
-        mock_builder.with_name.assert_called_with("Test Workflow")
-
-    def test_get_agent_storage_not_implemented(self):
-        """Test _get_agent_storage when not implemented."""
-        resolver = WorkflowResolver()
-        result = resolver._get_agent_storage()
-        assert result is None
-
-    @patch("engine_cli.commands.team.get_team_storage")
-    def test_get_team_storage_success(self, mock_get_team_storage):
-        """Test _get_team_storage when available."""
-        mock_storage = MagicMock()
-        mock_get_team_storage.return_value = mock_storage
-
-        resolver = WorkflowResolver()
-        result = resolver._get_team_storage()
-        assert result == mock_storage
-        assert resolver.team_storage == mock_storage
-
-    @patch("engine_cli.commands.team.get_team_storage", side_effect=ImportError())
-    def test_get_team_storage_import_error(self, mock_get_team_storage):
-        """Test _get_team_storage when import fails."""
-        resolver = WorkflowResolver()
-        result = resolver._get_team_storage()
-        assert result is None
-
-    @patch("engine_cli.commands.workflow.WorkflowBuilder")
-    def test_resolve_workflow_with_config(self, mock_builder_class):
-        """Test workflow resolution with complex config."""
-        resolver = WorkflowResolver()
-
-        # Mock builder
-        mock_builder = MagicMock()
-        mock_builder.with_id.return_value = mock_builder
-        mock_builder.with_name.return_value = mock_builder
-        mock_builder.add_function_vertex.return_value = mock_builder
-        mock_builder.build.return_value = MagicMock()
-        mock_builder_class.return_value = mock_builder
-
-        workflow_data = {
+        },
+        id="basic",
+    ),
+    pytest.param(
+        {
             "id": "complex_workflow",
             "name": "Complex Workflow",
             "vertex_count": 3,
@@ -373,30 +312,84 @@ class TestWorkflowResolver:
                     {"from_vertex": "v2", "to_vertex": "v3"},
                 ],
             },
-        }
+        },
+        id="with_config",
+    ),
+]
+
+
+@pytest.fixture
+def resolver_ctx(monkeypatch, mock_builder):
+    """WorkflowResolver whose WorkflowBuilder is patched to return mock_builder."""
+    builder_class = Mock(return_value=mock_builder)
+    monkeypatch.setattr("engine_cli.commands.workflow.WorkflowBuilder", builder_class)
+    return SimpleNamespace(
+        resolver=WorkflowResolver(), builder=mock_builder, builder_class=builder_class
+    )
 
-        result = resolver.resolve_workflow(workflow_data)
 
-        assert result is not None
-        mock_builder.with_id.assert_called_once_with("complex_workflow")
-        mock_builder.with_name.assert_called_once_with("Complex Workflow")
-        mock_builder.add_function_vertex.assert_called_once()
-        mock_builder.build.assert_called_once()
+# The resolver and CLI tests patch engine_cli.commands.workflow directly
+_requires_cli = pytest.mark.skipif(not _REAL_CLI, reason="engine_cli not importable")
 
-    @patch("engine_cli.commands.workflow.WorkflowBuilder")
-    def test_resolve_workflow_exception_handling(self, mock_builder_class):
-        """Test workflow resolution with exception handling."""
+
+@_requires_cli
+class TestWorkflowResolver:
+    """Test WorkflowResolver class."""
+
+    def test_init(self):
+        """Test WorkflowResolver initialization."""
+        resolver = WorkflowResolver()
+        assert resolver.agent_storage is None
+        assert resolver.team_storage is None
+
+    def test_get_agent_storage_not_implemented(self):
+        """Test _get_agent_storage when not implemented."""
+        resolver = WorkflowResolver()
+        result = resolver._get_agent_storage()
+        assert result is None
+
+    @patch("engine_cli.commands.team.get_team_storage")
+    def test_get_team_storage_success(self, mock_get_team_storage):
+        """Test _get_team_storage when available."""
+        mock_storage = sentinel.team_storage
+        mock_get_team_storage.return_value = mock_storage
+
+        resolver = WorkflowResolver()
+        result = resolver._get_team_storage()
+        assert result == mock_storage
+        assert resolver.team_storage == mock_storage
+
+    @patch("engine_cli.commands.team.get_team_storage", side_effect=ImportError())
+    def test_get_team_storage_import_error(self, mock_get_team_storage):
+        """Test _get_team_storage when import fails."""
         resolver = WorkflowResolver()
+        result = resolver._get_team_storage()
+        assert result is None
 
+    @pytest.mark.parametrize("workflow_data", _RESOLVE_CASES)
+    def test_resolve_workflow(self, resolver_ctx, workflow_data):
+        """Test workflow resolution for basic and config-heavy workflows."""
+        result = resolver_ctx.resolver.resolve_workflow(dict(workflow_data))
+
+        assert result is not None
+        builder = resolver_ctx.builder
+        resolver_ctx.builder_class.assert_called_once()
+        builder.with_id.assert_called_once_with(workflow_data["id"])
+        builder.with_name.assert_called_once_with(workflow_data["name"])
+        builder.add_function_vertex.assert_called_once()
+        builder.build.assert_called_once()
+
+    def test_resolve_workflow_exception_handling(self, resolver_ctx):
+        """Test workflow resolution with exception handling."""
         # Mock builder to raise exception
-        mock_builder_class.side_effect = Exception("Builder error")
+        resolver_ctx.builder_class.side_effect = Exception("Builder error")
 
         workflow_data = {"id": "error_workflow", "name": "Error Workflow"}
 
-        result = resolver.resolve_workflow(workflow_data)
+        result = resolver_ctx.resolver.resolve_workflow(workflow_data)
 
         assert result is None
-        mock_builder_class.assert_called_once()
+        resolver_ctx.builder_class.assert_called_once()
 
     def test_resolve_workflow_minimal_data(self):
         """Test workflow resolution with minimal data."""
@@ -459,49 +452,163 @@ class TestWorkflowFunctions:
             assert service is None
 
 
+# 10 KB --input-data payload, serialized once at import
+_LARGE_JSON_INPUT = _json_dumps({"data": "x" * 10_000})
+_NESTED_JSON = _json_dumps(
+    {"level1": {"level2": {"level3": {"level4": {"level5": "deep"}}}}}
+)
+_ARRAY_JSON = _json_dumps([1, 2, 3, "test", {"key": "value"}])
+_SPECIAL_JSON = _json_dumps(
+    {
+        "special": "àáâãäåæçèéêëìíîïðñòóôõö÷øùúûüýþÿ",
+        "unicode": "🚀🌟💻🔧⚡",
+        "quotes": '"single\'double"',
+        "slashes": "path\\to\\file",
+        "newlines": "line1\nline2\tline3",
+    }
+)
+
+# --input-data payloads for run/test and whether they should be rejected
+_INPUT_DATA_CASES = [
+    pytest.param("invalid json{", True, id="invalid_json"),
+    # Empty string and null are valid JSON documents
+    pytest.param('""', False, id="empty"),
+    pytest.param("   ", True, id="whitespace"),
+    pytest.param("null", False, id="null"),
+    pytest.param(_LARGE_JSON_INPUT, False, id="large"),
+    pytest.param(_NESTED_JSON, False, id="nested"),
+    pytest.param(_ARRAY_JSON, False, id="array"),
+    pytest.param(_SPECIAL_JSON, False, id="special_characters"),
+]
+
+
+def _assert_not_found(result):
+    """The not-found errors are lowercase, so match without a .lower() copy."""
+    assert "not found" in result.output
+
+
+# Read-only listing records for the many-workflows list test, built once
+_MOCK_100_WORKFLOWS = tuple(
+    MappingProxyType(
+        {
+            "id": f"workflow_{i}",
+            "name": f"Workflow {i}",
+            "version": "1.0.0",
+            "vertex_count": 2,
+            "edge_count": 1,
+            "created_at": "2024-01-01T10:00:00Z",
+        }
+    )
+    for i in range(100)
+)
+
+# Workflow IDs no storage knows about, with shapes the commands must tolerate
+_UNKNOWN_WORKFLOW_IDS = [
+    pytest.param("a" * 1000, id="very_long_id"),
+    pytest.param("workflow with spaces", id="id_with_spaces"),
+    pytest.param("workflow@#$%^&*()", id="id_with_special_chars"),
+]
+
+# Subcommands resolved once; tests invoke them directly, skipping group dispatch.
+# Frozen here rather than on cli.commands, which other modules may extend.
+_CMDS = MappingProxyType(
+    {
+        name: cli.commands[name]
+        for name in ("create", "list", "show", "delete", "run", "test")
+    }
+)
+
+
+def _invoke(runner, name, *args):
+    """Invoke one workflow subcommand with args, like `cli name args...`."""
+    return runner.invoke(_CMDS[name], list(args))
+
+
+def _option_defaults(command):
+    """Option values Click passes to the callback when none are given."""
+    params = command.make_context(command.name, [], resilient_parsing=True).params
+    return {
+        p.name: params[p.name] for p in command.params if isinstance(p, click.Option)
+    }
+
+
+# Option values Click would fill in when a command callback is called directly
+_CALLBACK_DEFAULTS = MappingProxyType(
+    {name: _option_defaults(command) for name, command in _CMDS.items()}
+)
+
+
+# Stored workflow records, frozen so no test can mutate the shared copies.
+# The commands only read them with .get(), so stubs return them as-is.
+_MOCK_WORKFLOW_DATA = MappingProxyType({"id": "test_workflow", "name": "Test Workflow"})
+
+_SHOW_WORKFLOW_DATA = MappingProxyType(
+    {
+        "id": "test_workflow",
+        "name": "Test Workflow",
+        "description": "A test workflow",
+        "version": "1.0.0",
+        "vertex_count": 2,
+        "edge_count": 1,
+        "config": MappingProxyType({"some_config": "value"}),
+    }
+)
+
+
+@_requires_cli
 class TestWorkflowCLI:
     """Test workflow CLI commands."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
-    @patch("engine_cli.commands.workflow.WorkflowStorage")
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("yaml.safe_load")
-    def test_show_command_success(self, mock_yaml_load, mock_file, mock_storage_class):
-        """Test show command for existing workflow."""
-        mock_storage = MagicMock()
-        mock_storage.list_workflows.return_value = [
-            {"id": "test_workflow", "file": "test_workflow.yaml"}
-        ]
-        mock_storage_class.return_value = mock_storage
-
-        workflow_data = {
-            "id": "test_workflow",
-            "name": "Test Workflow",
-            "description": "A test workflow",
-        }
-        mock_yaml_load.return_value = workflow_data
+    @pytest.fixture(scope="class")
+    def runner(self):
+        return CliRunner()
+
+    @pytest.fixture
+    def call_cmd(self, capsys):
+        """Run a command callback in-process and return its result like invoke()."""
+
+        def call(name, *args, **kwargs):
+            options = {**_CALLBACK_DEFAULTS[name], **kwargs}
+            try:
+                _CMDS[name].callback(*args, **options)
+                exit_code = 0
+            except SystemExit as e:
+                exit_code = e.code
+            return SimpleNamespace(exit_code=exit_code, output=capsys.readouterr().out)
+
+        return call
+
+    @pytest.fixture(autouse=True)
+    def mock_storage(self, monkeypatch):
+        """Replace the module-level workflow_storage for every CLI test."""
+        storage = Mock(spec_set=WorkflowStorage)
+        monkeypatch.setattr("engine_cli.commands.workflow.workflow_storage", storage)
+        yield storage
+
+    @pytest.mark.fs
+    def test_show_command_success(self, runner, tmp_path, monkeypatch):
+        """Test show command parsing a real workflow file from storage."""
+        monkeypatch.chdir(tmp_path)
+        storage = WorkflowStorage()
+        _write_workflow(
+            "test_workflow",
+            {
+                "id": "test_workflow",
+                "name": "Test Workflow",
+                "description": "A test workflow",
+            },
+        )
+        monkeypatch.setattr("engine_cli.commands.workflow.workflow_storage", storage)
 
-        result = self.runner.invoke(cli, ["show", "test_workflow"])
+        result = runner.invoke(cli, ["show", "test_workflow"])
         assert result.exit_code == 0
         assert "Test Workflow" in result.output
 
-    @patch("engine_cli.commands.workflow.WorkflowStorage")
-    @patch("os.path.exists")
-    @patch("os.remove")
-    def test_delete_command_success(self, mock_remove, mock_exists, mock_storage_class):
+    def test_delete_command_success(self, mock_storage, runner):
         """Test delete command success."""
-        mock_storage = MagicMock()
-        mock_storage.list_workflows.return_value = [
-            {"id": "test_workflow", "file": "test_workflow.yaml"}
-        ]
-        mock_storage_class.return_value = mock_storage
-
-        mock_exists.return_value = True
+        mock_storage.delete_workflow.return_value = True
 
-        result = self.runner.invoke(cli, ["delete", "test_workflow", "--force"])
+        result = runner.invoke(cli, ["delete", "test_workflow", "--force"])
         assert result.exit_code == 0
 
     def test_create_from_config_file(self):
@@ -510,45 +617,36 @@ class TestWorkflowCLI:
         # TODO: Fix file mocking for config file test
 
     @patch("engine_cli.commands.workflow.CLIWorkflowBuilder")
-    def test_create_manual_agent_vertices(self, mock_builder_class):
+    def test_create_manual_agent_vertices(
+        self, mock_builder_class, mock_builder, runner
+    ):
         """Test workflow creation with manual agent vertex specification."""
-        # Mock builder
-        mock_builder = MagicMock()
-        mock_builder.with_id.return_value = mock_builder
-        mock_builder.with_name.return_value = mock_builder
-        mock_builder.with_description.return_value = mock_builder
-        mock_builder.with_version.return_value = mock_builder
-        mock_builder.add_agent_vertex.return_value = mock_builder
-
         # Mock workflow object
-        mock_workflow = MagicMock()
+        mock_workflow = Mock(spec_set=_WORKFLOW_ATTRS)
         mock_workflow.id = "manual_workflow"
         mock_workflow.name = "manual_workflow"
         mock_workflow.vertex_count = 2
         mock_workflow.edge_count = 0
         mock_workflow.state.value = "CREATED"
-        mock_workflow.config = MagicMock()
-        mock_workflow.config.description = "Manual workflow"
-        mock_workflow.config.version = "1.5.0"
+        mock_workflow.config = SimpleNamespace(
+            description="Manual workflow", version="1.5.0"
+        )
         mock_builder.build.return_value = mock_workflow
-
         mock_builder_class.return_value = mock_builder
 
         # Test create with manual agent specs
-        result = self.runner.invoke(
-            cli,
-            [
-                "create",
-                "manual_workflow",
-                "--description",
-                "Manual workflow",
-                "--version",
-                "1.5.0",
-                "--agent",
-                "vertex1:agent1:Process input",
-                "--agent",
-                "vertex2:agent2:Generate output",
-            ],
+        result = _invoke(
+            runner,
+            "create",
+            "manual_workflow",
+            "--description",
+            "Manual workflow",
+            "--version",
+            "1.5.0",
+            "--agent",
+            "vertex1:agent1:Process input",
+            "--agent",
+            "vertex2:agent2:Generate output",
         )
 
         # Should succeed
@@ -579,18 +677,16 @@ class TestWorkflowCLI:
         # Skip this test for now - validation logic is hard to test with mocks
         # TODO: Fix validation testing with proper mocking
 
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_list_workflows_empty(self, mock_storage):
+    def test_list_workflows_empty(self, mock_storage, runner):
         """Test listing workflows when none exist."""
         mock_storage.list_workflows.return_value = []
 
-        result = self.runner.invoke(cli, ["list"])
+        result = _invoke(runner, "list")
 
         assert result.exit_code == 0
         assert "No workflows found" in result.output
 
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_list_workflows_with_data(self, mock_storage):
+    def test_list_workflows_with_data(self, mock_storage, call_cmd):
         """Test listing workflows with data."""
         mock_workflows = [
             {
@@ -612,7 +708,7 @@ class TestWorkflowCLI:
         ]
         mock_storage.list_workflows.return_value = mock_workflows
 
-        result = self.runner.invoke(cli, ["list"])
+        result = call_cmd("list")
 
         assert result.exit_code == 0
         assert "workflow1" in result.output
@@ -621,534 +717,140 @@ class TestWorkflowCLI:
         assert "Workflow Two" in result.output
         assert "Found 2 workflow(s)" in result.output
 
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_show_workflow_not_found(self, mock_storage):
+    def test_show_workflow_not_found(self, mock_storage, call_cmd):
         """Test showing a workflow that doesn't exist."""
         mock_storage.load_workflow.return_value = None
 
-        result = self.runner.invoke(cli, ["show", "nonexistent"])
+        result = call_cmd("show", "nonexistent")
 
         assert result.exit_code == 1
-        assert "not found" in result.output.lower()
+        _assert_not_found(result)
 
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_show_workflow_success(self, mock_storage):
+    def test_show_workflow_success(self, mock_storage, call_cmd):
         """Test showing workflow details successfully."""
-        mock_workflow_data = {
-            "id": "test_workflow",
-            "name": "Test Workflow",
-            "description": "A test workflow",
-            "version": "1.0.0",
-            "vertex_count": 2,
-            "edge_count": 1,
-            "config": {"some_config": "value"},
-        }
-        mock_storage.load_workflow.return_value = mock_workflow_data
+        mock_storage.load_workflow.return_value = _SHOW_WORKFLOW_DATA
 
-        result = self.runner.invoke(cli, ["show", "test_workflow"])
+        result = call_cmd("show", "test_workflow")
 
         assert result.exit_code == 0
         assert "test_workflow" in result.output
         assert "Test Workflow" in result.output
         assert "A test workflow" in result.output
 
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_delete_workflow_not_found(self, mock_storage):
+    def test_delete_workflow_not_found(self, mock_storage, call_cmd):
         """Test deleting a workflow that doesn't exist."""
         mock_storage.delete_workflow.return_value = False
 
-        result = self.runner.invoke(cli, ["delete", "nonexistent", "--force"])
+        result = call_cmd("delete", "nonexistent", force=True)
 
         assert result.exit_code == 1
-        assert "not found" in result.output.lower()
+        _assert_not_found(result)
 
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_delete_workflow_success(self, mock_storage):
+    def test_delete_workflow_success(self, mock_storage, call_cmd):
         """Test deleting a workflow successfully."""
         mock_storage.delete_workflow.return_value = True
 
-        result = self.runner.invoke(cli, ["delete", "test_workflow", "--force"])
+        result = call_cmd("delete", "test_workflow", force=True)
 
         assert result.exit_code == 0
         assert "deleted successfully" in result.output
 
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_delete_workflow_without_force(self, mock_storage):
+    def test_delete_workflow_without_force(self, call_cmd):
         """Test deleting a workflow without --force flag."""
-        result = self.runner.invoke(cli, ["delete", "test_workflow"])
+        result = call_cmd("delete", "test_workflow")
 
         assert result.exit_code == 0
         assert "Use --force to confirm" in result.output
 
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_run_workflow_invalid_json_input(self, mock_storage):
-        """Test running a workflow with invalid JSON input."""
-        mock_workflow_data = {"id": "test_workflow", "name": "Test Workflow"}
-        mock_storage.load_workflow.return_value = mock_workflow_data
-
-        result = self.runner.invoke(
-            cli, ["run", "test_workflow", "--input-data", "invalid json{"]
-        )
-
-        assert result.exit_code == 0
-        assert "Invalid JSON" in result.output
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_test_workflow_invalid_json_input(self, mock_storage):
-        """Test testing a workflow with invalid JSON input."""
-        mock_workflow_data = {"id": "test_workflow", "name": "Test Workflow"}
-        mock_storage.load_workflow.return_value = mock_workflow_data
-
-        result = self.runner.invoke(
-            cli, ["test", "test_workflow", "--input-data", "invalid json{"]
-        )
-
-        assert result.exit_code == 0
-        assert "Invalid JSON" in result.output
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_run_workflow_empty_input_data(self, mock_storage):
-        """Test running a workflow with empty input data."""
-        mock_workflow_data = {"id": "test_workflow", "name": "Test Workflow"}
-        mock_storage.load_workflow.return_value = mock_workflow_data
-
-        result = self.runner.invoke(cli, ["run", "test_workflow", "--input-data", '""'])
-
-        assert result.exit_code == 0
-        # Empty string is valid JSON, so should not show "Invalid JSON"
-        assert "Invalid JSON" not in result.output
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_test_workflow_empty_input_data(self, mock_storage):
-        """Test testing a workflow with empty input data."""
-        mock_workflow_data = {"id": "test_workflow", "name": "Test Workflow"}
-        mock_storage.load_workflow.return_value = mock_workflow_data
-
-        result = self.runner.invoke(
-            cli, ["test", "test_workflow", "--input-data", '""']
-        )
-
-        assert result.exit_code == 0
-        # Empty string is valid JSON, so should not show "Invalid JSON"
-        assert "Invalid JSON" not in result.output
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_run_workflow_whitespace_input_data(self, mock_storage):
-        """Test running a workflow with whitespace-only input data."""
-        mock_workflow_data = {"id": "test_workflow", "name": "Test Workflow"}
-        mock_storage.load_workflow.return_value = mock_workflow_data
-
-        result = self.runner.invoke(
-            cli, ["run", "test_workflow", "--input-data", "   "]
-        )
-
-        assert result.exit_code == 0
-        assert "Invalid JSON" in result.output
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_test_workflow_whitespace_input_data(self, mock_storage):
-        """Test testing a workflow with whitespace-only input data."""
-        mock_workflow_data = {"id": "test_workflow", "name": "Test Workflow"}
-        mock_storage.load_workflow.return_value = mock_workflow_data
-
-        result = self.runner.invoke(
-            cli, ["test", "test_workflow", "--input-data", "   "]
-        )
-
-        assert result.exit_code == 0
-        assert "Invalid JSON" in result.output
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_run_workflow_null_input_data(self, mock_storage):
-        """Test running a workflow with null input data."""
-        mock_workflow_data = {"id": "test_workflow", "name": "Test Workflow"}
-        mock_storage.load_workflow.return_value = mock_workflow_data
-
-        result = self.runner.invoke(
-            cli, ["run", "test_workflow", "--input-data", "null"]
-        )
-
-        assert result.exit_code == 0
-        # Should accept null as valid JSON
-        assert "Invalid JSON" not in result.output
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_test_workflow_null_input_data(self, mock_storage):
-        """Test testing a workflow with null input data."""
-        mock_workflow_data = {"id": "test_workflow", "name": "Test Workflow"}
-        mock_storage.load_workflow.return_value = mock_workflow_data
-
-        result = self.runner.invoke(
-            cli, ["test", "test_workflow", "--input-data", "null"]
-        )
-
-        assert result.exit_code == 0
-        # Should accept null as valid JSON
-        assert "Invalid JSON" not in result.output
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_run_workflow_large_json_input(self, mock_storage):
-        """Test running a workflow with large JSON input."""
-        mock_workflow_data = {"id": "test_workflow", "name": "Test Workflow"}
-        mock_storage.load_workflow.return_value = mock_workflow_data
-
-        # Create a large JSON object
-        large_data = {"data": "x" * 10000}
-        large_json = json.dumps(large_data)
+    @pytest.fixture
+    def storage_with_workflow(self, mock_storage):
+        """workflow_storage mock that finds test_workflow."""
+        mock_storage.load_workflow.return_value = _MOCK_WORKFLOW_DATA
+        return mock_storage
 
-        result = self.runner.invoke(
-            cli, ["run", "test_workflow", "--input-data", large_json]
-        )
-
-        assert result.exit_code == 0
-        # Should handle large JSON without issues
-        assert "Invalid JSON" not in result.output
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_test_workflow_large_json_input(self, mock_storage):
-        """Test testing a workflow with large JSON input."""
-        mock_workflow_data = {"id": "test_workflow", "name": "Test Workflow"}
-        mock_storage.load_workflow.return_value = mock_workflow_data
-
-        # Create a large JSON object
-        large_data = {"data": "x" * 10000}
-        large_json = json.dumps(large_data)
-
-        result = self.runner.invoke(
-            cli, ["test", "test_workflow", "--input-data", large_json]
-        )
-
-        assert result.exit_code == 0
-        # Should handle large JSON without issues
-        assert "Invalid JSON" not in result.output
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_run_workflow_nested_json_input(self, mock_storage):
-        """Test running a workflow with deeply nested JSON input."""
-        mock_workflow_data = {"id": "test_workflow", "name": "Test Workflow"}
-        mock_storage.load_workflow.return_value = mock_workflow_data
-
-        # Create deeply nested JSON
-        nested_data = {"level1": {"level2": {"level3": {"level4": {"level5": "deep"}}}}}
-        nested_json = json.dumps(nested_data)
-
-        result = self.runner.invoke(
-            cli, ["run", "test_workflow", "--input-data", nested_json]
-        )
-
-        assert result.exit_code == 0
-        # Should handle nested JSON without issues
-        assert "Invalid JSON" not in result.output
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_test_workflow_nested_json_input(self, mock_storage):
-        """Test testing a workflow with deeply nested JSON input."""
-        mock_workflow_data = {"id": "test_workflow", "name": "Test Workflow"}
-        mock_storage.load_workflow.return_value = mock_workflow_data
-
-        # Create deeply nested JSON
-        nested_data = {"level1": {"level2": {"level3": {"level4": {"level5": "deep"}}}}}
-        nested_json = json.dumps(nested_data)
-
-        result = self.runner.invoke(
-            cli, ["test", "test_workflow", "--input-data", nested_json]
-        )
-
-        assert result.exit_code == 0
-        # Should handle nested JSON without issues
-        assert "Invalid JSON" not in result.output
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_run_workflow_array_input(self, mock_storage):
-        """Test running a workflow with JSON array input."""
-        mock_workflow_data = {"id": "test_workflow", "name": "Test Workflow"}
-        mock_storage.load_workflow.return_value = mock_workflow_data
-
-        array_data = [1, 2, 3, "test", {"key": "value"}]
-        array_json = json.dumps(array_data)
-
-        result = self.runner.invoke(
-            cli, ["run", "test_workflow", "--input-data", array_json]
-        )
-
-        assert result.exit_code == 0
-        # Should handle JSON array without issues
-        assert "Invalid JSON" not in result.output
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_test_workflow_array_input(self, mock_storage):
-        """Test testing a workflow with JSON array input."""
-        mock_workflow_data = {"id": "test_workflow", "name": "Test Workflow"}
-        mock_storage.load_workflow.return_value = mock_workflow_data
-
-        array_data = [1, 2, 3, "test", {"key": "value"}]
-        array_json = json.dumps(array_data)
-
-        result = self.runner.invoke(
-            cli, ["test", "test_workflow", "--input-data", array_json]
-        )
-
-        assert result.exit_code == 0
-        # Should handle JSON array without issues
-        assert "Invalid JSON" not in result.output
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_run_workflow_special_characters(self, mock_storage):
-        """Test running a workflow with special characters in JSON."""
-        mock_workflow_data = {"id": "test_workflow", "name": "Test Workflow"}
-        mock_storage.load_workflow.return_value = mock_workflow_data
-
-        special_data = {
-            "special": "àáâãäåæçèéêëìíîïðñòóôõö÷øùúûüýþÿ",
-            "unicode": "🚀🌟💻🔧⚡",
-            "quotes": '"single\'double"',
-            "slashes": "path\\to\\file",
-            "newlines": "line1\nline2\tline3",
-        }
-        special_json = json.dumps(special_data)
-
-        result = self.runner.invoke(
-            cli, ["run", "test_workflow", "--input-data", special_json]
-        )
-
-        assert result.exit_code == 0
-        # Should handle special characters without issues
-        assert "Invalid JSON" not in result.output
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_test_workflow_special_characters(self, mock_storage):
-        """Test testing a workflow with special characters in JSON."""
-        mock_workflow_data = {"id": "test_workflow", "name": "Test Workflow"}
-        mock_storage.load_workflow.return_value = mock_workflow_data
-
-        special_data = {
-            "special": "àáâãäåæçèéêëìíîïðñòóôõö÷øùúûüýþÿ",
-            "unicode": "🚀🌟💻🔧⚡",
-            "quotes": '"single\'double"',
-            "slashes": "path\\to\\file",
-            "newlines": "line1\nline2\tline3",
-        }
-        special_json = json.dumps(special_data)
-
-        result = self.runner.invoke(
-            cli, ["test", "test_workflow", "--input-data", special_json]
-        )
+    @pytest.mark.parametrize("cmd", ["run", "test"])
+    @pytest.mark.parametrize("payload, invalid", _INPUT_DATA_CASES)
+    def test_input_data_validation(
+        self, storage_with_workflow, cmd, payload, invalid, call_cmd
+    ):
+        """Test run/test --input-data parsing for valid and invalid JSON."""
+        result = call_cmd(cmd, "test_workflow", input_data=payload)
 
         assert result.exit_code == 0
-        # Should handle special characters without issues
-        assert "Invalid JSON" not in result.output
+        assert ("Invalid JSON" in result.output) is invalid
 
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_run_workflow_empty_workflow_id(self, mock_storage):
-        """Test running a workflow with empty workflow ID - should fail."""
-        result = self.runner.invoke(cli, ["run"])
-
-        # Click requires workflow_id argument
-        assert result.exit_code == 2
-        assert "Missing argument" in result.output
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_test_workflow_empty_workflow_id(self, mock_storage):
-        """Test testing a workflow with empty workflow ID - should fail."""
-        result = self.runner.invoke(cli, ["test"])
-
-        # Click requires workflow_id argument
-        assert result.exit_code == 2
-        assert "Missing argument" in result.output
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_show_workflow_empty_id(self, mock_storage):
-        """Test showing a workflow with empty ID - should fail."""
-        result = self.runner.invoke(cli, ["show"])
-
-        # Click requires workflow_id argument
-        assert result.exit_code == 2
-        assert "Missing argument" in result.output
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_delete_workflow_empty_id(self, mock_storage):
-        """Test deleting a workflow with empty ID - should fail."""
-        result = self.runner.invoke(cli, ["delete", "--force"])
+    @pytest.mark.parametrize(
+        "argv",
+        [["run"], ["test"], ["show"], ["delete", "--force"]],
+        ids=["run", "test", "show", "delete"],
+    )
+    def test_missing_workflow_id(self, runner, argv):
+        """Test that each command requires a workflow ID argument."""
+        result = _invoke(runner, *argv)
 
         # Click requires workflow_id argument
         assert result.exit_code == 2
         assert "Missing argument" in result.output
 
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_run_workflow_very_long_id(self, mock_storage):
-        """Test running a workflow with very long ID."""
-        mock_storage.load_workflow.return_value = None
-
-        long_id = "a" * 1000  # Very long workflow ID
-
-        result = self.runner.invoke(cli, ["run", long_id])
-
-        assert result.exit_code == 0
-        assert "not found" in result.output.lower()
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_test_workflow_very_long_id(self, mock_storage):
-        """Test testing a workflow with very long ID."""
-        mock_storage.load_workflow.return_value = None
-
-        long_id = "a" * 1000  # Very long workflow ID
-
-        result = self.runner.invoke(cli, ["test", long_id])
-
-        assert result.exit_code == 0
-        assert "not found" in result.output.lower()
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_show_workflow_very_long_id(self, mock_storage):
-        """Test showing a workflow with very long ID."""
-        mock_storage.load_workflow.return_value = None
-
-        long_id = "a" * 1000  # Very long workflow ID
-
-        result = self.runner.invoke(cli, ["show", long_id])
-
-        assert result.exit_code == 1
-        assert "not found" in result.output.lower()
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_delete_workflow_very_long_id(self, mock_storage):
-        """Test deleting a workflow with very long ID."""
-        mock_storage.delete_workflow.return_value = False
-
-        long_id = "a" * 1000  # Very long workflow ID
-
-        result = self.runner.invoke(cli, ["delete", long_id, "--force"])
-
-        assert result.exit_code == 1
-        assert "not found" in result.output.lower()
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_run_workflow_id_with_spaces(self, mock_storage):
-        """Test running a workflow with ID containing spaces."""
-        mock_storage.load_workflow.return_value = None
-
-        result = self.runner.invoke(cli, ["run", "workflow with spaces"])
-
-        assert result.exit_code == 0
-        assert "not found" in result.output.lower()
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_test_workflow_id_with_spaces(self, mock_storage):
-        """Test testing a workflow with ID containing spaces."""
-        mock_storage.load_workflow.return_value = None
-
-        result = self.runner.invoke(cli, ["test", "workflow with spaces"])
-
-        assert result.exit_code == 0
-        assert "not found" in result.output.lower()
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_show_workflow_id_with_spaces(self, mock_storage):
-        """Test showing a workflow with ID containing spaces."""
-        mock_storage.load_workflow.return_value = None
-
-        result = self.runner.invoke(cli, ["show", "workflow with spaces"])
-
-        assert result.exit_code == 1
-        assert "not found" in result.output.lower()
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_delete_workflow_id_with_spaces(self, mock_storage):
-        """Test deleting a workflow with ID containing spaces."""
-        mock_storage.delete_workflow.return_value = False
-
-        result = self.runner.invoke(cli, ["delete", "workflow with spaces", "--force"])
-
-        assert result.exit_code == 1
-        assert "not found" in result.output.lower()
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_run_workflow_id_with_special_chars(self, mock_storage):
-        """Test running a workflow with ID containing special characters."""
-        mock_storage.load_workflow.return_value = None
-
-        result = self.runner.invoke(cli, ["run", "workflow@#$%^&*()"])
-
-        assert result.exit_code == 0
-        assert "not found" in result.output.lower()
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_test_workflow_id_with_special_chars(self, mock_storage):
-        """Test testing a workflow with ID containing special characters."""
-        mock_storage.load_workflow.return_value = None
-
-        result = self.runner.invoke(cli, ["test", "workflow@#$%^&*()"])
-
-        assert result.exit_code == 0
-        assert "not found" in result.output.lower()
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_show_workflow_id_with_special_chars(self, mock_storage):
-        """Test showing a workflow with ID containing special characters."""
+    @pytest.mark.parametrize("workflow_id", _UNKNOWN_WORKFLOW_IDS)
+    @pytest.mark.parametrize(
+        "cmd, exit_code", [("run", 0), ("test", 0), ("show", 1), ("delete", 1)]
+    )
+    def test_unknown_workflow_id(
+        self, mock_storage, call_cmd, cmd, exit_code, workflow_id
+    ):
+        """Test each command with long, spaced and special-character IDs."""
         mock_storage.load_workflow.return_value = None
-
-        result = self.runner.invoke(cli, ["show", "workflow@#$%^&*()"])
-
-        assert result.exit_code == 1
-        assert "not found" in result.output.lower()
-
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_delete_workflow_id_with_special_chars(self, mock_storage):
-        """Test deleting a workflow with ID containing special characters."""
         mock_storage.delete_workflow.return_value = False
 
-        result = self.runner.invoke(cli, ["delete", "workflow@#$%^&*()", "--force"])
+        options = {"force": True} if cmd == "delete" else {}
+        result = call_cmd(cmd, workflow_id, **options)
 
-        assert result.exit_code == 1
-        assert "not found" in result.output.lower()
+        assert result.exit_code == exit_code
+        _assert_not_found(result)
 
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_list_workflows_large_number(self, mock_storage):
+    def test_list_workflows_large_number(self, mock_storage, call_cmd):
         """Test listing a large number of workflows."""
-        # Create a large list of workflows
-        mock_workflows = []
-        for i in range(100):
-            mock_workflows.append(
-                {
-                    "id": f"workflow_{i}",
-                    "name": f"Workflow {i}",
-                    "version": "1.0.0",
-                    "vertex_count": 2,
-                    "edge_count": 1,
-                    "created_at": "2024-01-01T10:00:00Z",
-                }
-            )
-
-        mock_storage.list_workflows.return_value = mock_workflows
+        mock_storage.list_workflows.return_value = _MOCK_100_WORKFLOWS
 
-        result = self.runner.invoke(cli, ["list"])
+        result = call_cmd("list")
 
         assert result.exit_code == 0
         assert "Found 100 workflow(s)" in result.output
         assert "workflow_0" in result.output
         assert "workflow_99" in result.output
 
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_run_workflow_multiple_times(self, mock_storage):
+    def test_run_workflow_multiple_times(self, storage_with_workflow, capsys):
         """Test running the same workflow multiple times."""
-        mock_workflow_data = {"id": "test_workflow", "name": "Test Workflow"}
-        mock_storage.load_workflow.return_value = mock_workflow_data
+        run = _CMDS["run"].callback
+        # Run the same workflow 3 times; should not crash on multiple runs
+        for _ in range(3):
+            run("test_workflow", input_data=None)
 
-        # Run the same workflow 3 times
-        for i in range(3):
-            result = self.runner.invoke(cli, ["run", "test_workflow"])
-            assert result.exit_code == 0
-            # Should not crash on multiple runs
+        assert storage_with_workflow.load_workflow.call_count == 3
+        assert capsys.readouterr().out.count("Running workflow") == 3
 
-    @patch("engine_cli.commands.workflow.workflow_storage")
-    def test_test_workflow_multiple_times(self, mock_storage):
+    def test_test_workflow_multiple_times(self, storage_with_workflow, capsys):
         """Test testing the same workflow multiple times."""
-        mock_workflow_data = {"id": "test_workflow", "name": "Test Workflow"}
-        mock_storage.load_workflow.return_value = mock_workflow_data
-
-        # Test the same workflow 3 times
-        for i in range(3):
-            result = self.runner.invoke(cli, ["test", "test_workflow"])
-            assert result.exit_code == 0
-            assert "Testing workflow" in result.output
-            # Should not crash on multiple tests
+        test = _CMDS["test"].callback
+        # Test the same workflow 3 times; should not crash on multiple tests
+        for _ in range(3):
+            test("test_workflow", input_data=None)
+
+        assert storage_with_workflow.load_workflow.call_count == 3
+        output = capsys.readouterr().out
+        assert output.count("Workflow test completed successfully") == 3
+
+
+if __name__ == "__main__":
+    pytest.main(
+        [
+            __file__,
+            "-p",
+            "no:cacheprovider",
+            "-p",
+            "no:stepwise",
+            "-p",
+            "no:junitxml",
+        ]
+    )
@@ -1,8 +1,9 @@
 """Unit tests for WorkflowExecutionService and PostgreSQL repository."""
 
 from datetime import datetime, timedelta
+from inspect import signature
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, MagicMock
 
 import pytest
 
@@ -29,27 +30,113 @@ try:
 except ImportError:
     pytest.skip("Workflow execution service not available", allow_module_level=True)
 
+# Every test in this module is a coroutine
+pytestmark = pytest.mark.asyncio
+
+_RUNNING_VALUE = WorkflowExecutionStatus.RUNNING.value
+
+# Fixed start time for executions whose duration the service computes
+_STARTED_AT = datetime(2024, 1, 1, 12, 0, 0)
+
+
+class FakeRepo:
+    """Async repository stand-in that records calls and returns preset values.
+
+    Signatures follow PostgreSQLWorkflowExecutionRepository: creation takes one
+    positional data dict, updates take ``(execution_id, updates)``.
+    """
+
+    __slots__ = ("returns", "calls")
+
+    def __init__(self, **returns):
+        self.returns = returns
+        self.calls = []
+
+    def _record(self, name, call):
+        self.calls.append((name, call))
+        return self.returns.get(name)
+
+    async def create_workflow_execution(self, execution_data):
+        return self._record("create_workflow_execution", execution_data)
+
+    async def get_workflow_execution(self, execution_id):
+        return self._record("get_workflow_execution", {"execution_id": execution_id})
+
+    async def update_workflow_execution(self, execution_id, updates):
+        return self._record(
+            "update_workflow_execution",
+            {"execution_id": execution_id, "updates": updates},
+        )
+
+    async def get_execution_analytics(self, workflow_id):
+        return self._record("get_execution_analytics", {"workflow_id": workflow_id})
+
+
+class FakeSession:
+    """Async session stand-in; ``execute`` hands back the preset ``result``."""
+
+    __slots__ = ("result", "calls")
+
+    def __init__(self, result=None):
+        self.result = result
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def add(self, instance):
+        self.calls.append(("add", instance))
+
+    async def commit(self):
+        self.calls.append(("commit", None))
+
+    async def refresh(self, instance):
+        self.calls.append(("refresh", instance))
+
+    async def execute(self, statement):
+        self.calls.append(("execute", statement))
+        return self.result
+
 
 class TestWorkflowExecutionService:
     """Test cases for WorkflowExecutionService."""
 
     @pytest.fixture
     def mock_repository(self):
-        """Create a mock repository for testing."""
-        return AsyncMock()
+        """Create a fake repository for testing."""
+        return FakeRepo()
 
     @pytest.fixture
     def execution_service(self, mock_repository):
         """Create a WorkflowExecutionService with mock repository."""
         return WorkflowExecutionService(mock_repository)
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "method",
+        [
+            "create_workflow_execution",
+            "get_workflow_execution",
+            "update_workflow_execution",
+            "get_execution_analytics",
+        ],
+    )
+    async def test_fake_repo_matches_repository(self, method):
+        """Test that FakeRepo takes the same arguments as the real repository."""
+        fake = signature(getattr(FakeRepo, method)).parameters.values()
+        real = signature(
+            getattr(PostgreSQLWorkflowExecutionRepository, method)
+        ).parameters.values()
+        assert [p.kind for p in fake] == [p.kind for p in real]
+
     async def test_create_execution(self, execution_service, mock_repository):
         """Test creating a new workflow execution."""
         # Setup mock
         mock_execution = MagicMock()
         mock_execution.execution_id = "test_exec_123"
-        mock_repository.create_workflow_execution.return_value = mock_execution
+        mock_repository.returns["create_workflow_execution"] = mock_execution
 
         # Execute
         result = await execution_service.create_execution(
@@ -61,42 +148,43 @@ class TestWorkflowExecutionService:
 
         # Assert
         assert result == mock_execution
-        mock_repository.create_workflow_execution.assert_called_once()
-        call_args = mock_repository.create_workflow_execution.call_args[1]
+        [(method, call_args)] = mock_repository.calls
+        assert method == "create_workflow_execution"
         assert call_args["workflow_id"] == "test_workflow"
         assert call_args["workflow_name"] == "Test Workflow"
         assert call_args["user_id"] == "user123"
         assert call_args["input_data"] == {"test": "data"}
 
-    @pytest.mark.asyncio
     async def test_start_execution(self, execution_service, mock_repository):
         """Test starting an execution."""
         # Setup mock
         mock_execution = MagicMock()
-        mock_repository.update_workflow_execution.return_value = mock_execution
+        mock_repository.returns["update_workflow_execution"] = mock_execution
 
         # Execute
         result = await execution_service.start_execution("exec_123")
 
         # Assert
         assert result == mock_execution
-        mock_repository.update_workflow_execution.assert_called_once_with(
-            "exec_123",
-            {
-                "status": WorkflowExecutionStatus.RUNNING.value,
-                "started_at": mock_repository.update_workflow_execution.call_args[1][
-                    "updates"
-                ]["started_at"],
-            },
-        )
+        assert mock_repository.calls == [
+            (
+                "update_workflow_execution",
+                {
+                    "execution_id": "exec_123",
+                    "updates": {
+                        "status": _RUNNING_VALUE,
+                        "started_at": ANY,
+                    },
+                },
+            )
+        ]
 
-    @pytest.mark.asyncio
     async def test_complete_execution_success(self, execution_service, mock_repository):
         """Test completing an execution successfully."""
         # Setup mock
         mock_execution = MagicMock()
-        mock_execution.started_at = datetime.utcnow() - timedelta(seconds=10)
-        mock_repository.update_workflow_execution.return_value = mock_execution
+        mock_execution.started_at = _STARTED_AT
+        mock_repository.returns["update_workflow_execution"] = mock_execution
 
         # Execute
         result = await execution_service.complete_execution(
@@ -106,15 +194,16 @@ class TestWorkflowExecutionService:
         # Assert
         assert result == mock_execution
         # Should have been called twice: once for completion, once for duration
-        assert mock_repository.update_workflow_execution.call_count == 2
+        assert [method for method, _ in mock_repository.calls].count(
+            "update_workflow_execution"
+        ) == 2
 
-    @pytest.mark.asyncio
     async def test_fail_execution(self, execution_service, mock_repository):
         """Test failing an execution."""
         # Setup mock
         mock_execution = MagicMock()
-        mock_execution.started_at = datetime.utcnow() - timedelta(seconds=5)
-        mock_repository.update_workflow_execution.return_value = mock_execution
+        mock_execution.started_at = _STARTED_AT
+        mock_repository.returns["update_workflow_execution"] = mock_execution
 
         # Execute
         result = await execution_service.fail_execution(
@@ -124,13 +213,14 @@ class TestWorkflowExecutionService:
         # Assert
         assert result == mock_execution
         # Should have been called twice: once for failure, once for duration
-        assert mock_repository.update_workflow_execution.call_count == 2
+        assert [method for method, _ in mock_repository.calls].count(
+            "update_workflow_execution"
+        ) == 2
 
-    @pytest.mark.asyncio
     async def test_get_execution_analytics(self, execution_service, mock_repository):
         """Test getting execution analytics."""
         # Setup mock
-        mock_repository.get_execution_analytics.return_value = {
+        mock_repository.returns["get_execution_analytics"] = {
             "total_executions": 10,
             "successful_executions": 8,
             "success_rate": 0.8,
@@ -143,59 +233,54 @@ class TestWorkflowExecutionService:
         assert result["total_executions"] == 10
         assert result["successful_executions"] == 8
         assert result["success_rate"] == 0.8
-        mock_repository.get_execution_analytics.assert_called_once_with("workflow_123")
+        assert mock_repository.calls == [
+            ("get_execution_analytics", {"workflow_id": "workflow_123"})
+        ]
 
 
 class TestPostgreSQLWorkflowExecutionRepository:
     """Test cases for PostgreSQLWorkflowExecutionRepository."""
 
     @pytest.fixture
-    def mock_session_factory(self):
-        """Create a mock session factory."""
-        return AsyncMock()
+    def session(self):
+        """Create a fake database session."""
+        return FakeSession()
 
     @pytest.fixture
-    def repository(self, mock_session_factory):
-        """Create a PostgreSQL repository with mock session factory."""
-        return PostgreSQLWorkflowExecutionRepository(mock_session_factory)
+    def repository(self, session):
+        """Create a PostgreSQL repository whose factory yields the fake session."""
+        return PostgreSQLWorkflowExecutionRepository(lambda: session)
 
-    @pytest.mark.asyncio
-    async def test_create_workflow_execution(self, repository, mock_session_factory):
+    async def test_create_workflow_execution(self, repository, session, monkeypatch):
         """Test creating a workflow execution in PostgreSQL."""
         # Setup mocks
-        mock_session = AsyncMock()
         mock_execution = MagicMock()
-        mock_session_factory.return_value = mock_session
-        mock_session.add.return_value = None
-        mock_session.commit.return_value = None
-        mock_session.refresh.return_value = None
 
         # Mock the WorkflowExecution constructor
-        with patch(
-            "engine_core.services.workflow_service.WorkflowExecution"
-        ) as mock_wf_exec:
-            mock_wf_exec.return_value = mock_execution
-
-            # Execute
-            result = await repository.create_workflow_execution(
-                {"workflow_id": "test_workflow", "execution_id": "test_exec"}
-            )
+        monkeypatch.setattr(
+            "engine_core.services.workflow_service.WorkflowExecution",
+            lambda *args, **kwargs: mock_execution,
+        )
+
+        # Execute
+        result = await repository.create_workflow_execution(
+            {"workflow_id": "test_workflow", "execution_id": "test_exec"}
+        )
 
-            # Assert
-            assert result == mock_execution
-            mock_session.add.assert_called_once_with(mock_execution)
-            mock_session.commit.assert_called_once()
-            mock_session.refresh.assert_called_once_with(mock_execution)
+        # Assert
+        assert result == mock_execution
+        assert session.calls == [
+            ("add", mock_execution),
+            ("commit", None),
+            ("refresh", mock_execution),
+        ]
 
-    @pytest.mark.asyncio
-    async def test_get_workflow_execution(self, repository, mock_session_factory):
+    async def test_get_workflow_execution(self, repository, session):
         """Test getting a workflow execution by ID."""
         # Setup mocks
-        mock_session = AsyncMock()
-        mock_result = AsyncMock()
+        mock_result = MagicMock()
         mock_execution = MagicMock()
-        mock_session_factory.return_value = mock_session
-        mock_session.execute.return_value = mock_result
+        session.result = mock_result
         mock_result.scalar_one_or_none.return_value = mock_execution
 
         # Execute
@@ -203,17 +288,14 @@ class TestPostgreSQLWorkflowExecutionRepository:
 
         # Assert
         assert result == mock_execution
-        mock_session.execute.assert_called_once()
+        assert [method for method, _ in session.calls] == ["execute"]
 
-    @pytest.mark.asyncio
-    async def test_get_workflow_executions(self, repository, mock_session_factory):
+    async def test_get_workflow_executions(self, repository, session):
         """Test getting workflow executions."""
         # Setup mocks
-        mock_session = AsyncMock()
-        mock_result = AsyncMock()
+        mock_result = MagicMock()
         mock_executions = [MagicMock(), MagicMock()]
-        mock_session_factory.return_value = mock_session
-        mock_session.execute.return_value = mock_result
+        session.result = mock_result
         mock_result.scalars.return_value = mock_executions
 
         # Execute
@@ -221,18 +303,13 @@ class TestPostgreSQLWorkflowExecutionRepository:
 
         # Assert
         assert result == mock_executions
-        mock_session.execute.assert_called_once()
+        assert [method for method, _ in session.calls] == ["execute"]
 
-    @pytest.mark.asyncio
-    async def test_get_execution_analytics_no_executions(
-        self, repository, mock_session_factory
-    ):
+    async def test_get_execution_analytics_no_executions(self, repository, session):
         """Test getting analytics when no executions exist."""
         # Setup mocks
-        mock_session = AsyncMock()
-        mock_result = AsyncMock()
-        mock_session_factory.return_value = mock_session
-        mock_session.execute.return_value = mock_result
+        mock_result = MagicMock()
+        session.result = mock_result
         mock_result.scalars.return_value = []
 
         # Execute
@@ -249,16 +326,11 @@ class TestPostgreSQLWorkflowExecutionRepository:
         }
         assert result == expected
 
-    @pytest.mark.asyncio
-    async def test_get_execution_analytics_with_executions(
-        self, repository, mock_session_factory
-    ):
+    async def test_get_execution_analytics_with_executions(self, repository, session):
         """Test getting analytics with executions."""
         # Setup mocks
-        mock_session = AsyncMock()
-        mock_result = AsyncMock()
-        mock_session_factory.return_value = mock_session
-        mock_session.execute.return_value = mock_result
+        mock_result = MagicMock()
+        session.result = mock_result
 
         # Create mock executions
         mock_exec1 = MagicMock()
@@ -292,7 +364,6 @@ class TestMockWorkflowRepository:
         """Create a MockWorkflowRepository."""
         return MockWorkflowRepository()
 
-    @pytest.mark.asyncio
     async def test_create_workflow(self, mock_repo):
         """Test creating a workflow in mock repository."""
         workflow_data = {
@@ -308,7 +379,6 @@ class TestMockWorkflowRepository:
         assert result.description == "A test workflow"
         assert mock_repo.workflows["test_workflow"]["id"] == "test_workflow"
 
-    @pytest.mark.asyncio
     async def test_get_workflow_by_id(self, mock_repo):
         """Test getting a workflow by ID."""
         # First create a workflow
@@ -322,7 +392,6 @@ class TestMockWorkflowRepository:
         assert result.id == "test_workflow"
         assert result.name == "Test"
 
-    @pytest.mark.asyncio
     async def test_get_nonexistent_workflow(self, mock_repo):
         """Test getting a workflow that doesn't exist."""
         result = await mock_repo.get_workflow_by_id("nonexistent")
@@ -1,8 +1,7 @@
 """Tests for WorkflowStateManager - Redis-based volatile state management."""
 
-import json
 from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from unittest.mock import ANY, AsyncMock, patch
 
 import pytest
 
@@ -13,39 +12,206 @@ from engine_cli.storage.workflow_state_manager import (
     WorkflowStateManager,
 )
 
+# Enum members the tests compare against, bound once
+_RUNNING = WorkflowExecutionState.RUNNING
+_COMPLETED = VertexExecutionState.COMPLETED
+
+# orjson encodes the seeded Redis payloads and decodes the written ones faster
+# when installed; its dumps returns bytes just as a real Redis client would
+try:
+    import orjson  # type: ignore
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    _dumps = json.dumps
+    _loads = json.loads
+
+# Fixed timestamp and pre-serialized Redis payloads seeded by the tests
+_FIXED_TS = "2024-01-01T00:00:00"
+
+# Stored execution fields shared by every payload; tests add the state
+_BASE_EXEC = {
+    "execution_id": "test_exec_123",
+    "workflow_id": "test_workflow",
+    "workflow_name": "Test Workflow",
+    "start_time": _FIXED_TS,
+    "input_data": {},
+    "vertex_states": {},
+}
+_RUNNING_EXEC = {**_BASE_EXEC, "state": "running"}
+_PENDING_EXEC_JSON = _dumps({**_BASE_EXEC, "state": "pending"})
+_RUNNING_EXEC_JSON = _dumps(_RUNNING_EXEC)
+_COMPLETED_EXEC_JSON = _dumps({**_RUNNING_EXEC, "state": "completed"})
+_STATUS_EXEC_JSON = _dumps(
+    {**_RUNNING_EXEC, "input_data": {"param": "value"}, "progress_percentage": 50.0}
+)
+_WORKFLOW_EXECUTIONS_JSON = (
+    _dumps({**_RUNNING_EXEC, "execution_id": "exec_1", "state": "completed"}),
+    _dumps({**_RUNNING_EXEC, "execution_id": "exec_2", "state": "failed"}),
+)
+_ACTIVE_EXECUTIONS_JSON = (
+    _dumps({**_RUNNING_EXEC, "execution_id": "exec_1"}),
+    _dumps({**_RUNNING_EXEC, "execution_id": "exec_2", "state": "completed"}),
+)
+
+# Status built once for the dataclass tests; to_dict() deep-copies, so the
+# tests never mutate it
+_SAMPLE_STATUS = WorkflowExecutionStatus(
+    execution_id="test_exec_123",
+    workflow_id="test_workflow",
+    workflow_name="Test Workflow",
+    state=_RUNNING,
+    start_time=datetime.fromisoformat(_FIXED_TS),
+    input_data={"param": "value"},
+    progress_percentage=75.5,
+)
 
+# Update ops run against a seeded execution: (method, seed, kwargs, returned,
+# expected subset of the rewritten payload)
+_UPDATE_CASES = [
+    pytest.param(
+        "update_execution_state",
+        _PENDING_EXEC_JSON,
+        {
+            "state": _RUNNING,
+            "current_vertex": "vertex1",
+            "progress_percentage": 25.0,
+        },
+        None,
+        {"state": "running", "current_vertex": "vertex1", "progress_percentage": 25.0},
+        id="update_execution_state",
+    ),
+    pytest.param(
+        "update_vertex_state",
+        _RUNNING_EXEC_JSON,
+        {
+            "vertex_id": "vertex1",
+            "state": _COMPLETED,
+            "output_data": {"result": "success"},
+        },
+        None,
+        {
+            "vertex_states": {
+                "vertex1": {
+                    "state": "completed",
+                    "updated_at": ANY,
+                    "output_data": {"result": "success"},
+                    "error_message": None,
+                }
+            }
+        },
+        id="update_vertex_state",
+    ),
+    pytest.param(
+        "set_execution_output",
+        _RUNNING_EXEC_JSON,
+        {"output_data": {"final_result": "workflow completed"}},
+        None,
+        {"output_data": {"final_result": "workflow completed"}},
+        id="set_execution_output",
+    ),
+    pytest.param(
+        "set_execution_error",
+        _RUNNING_EXEC_JSON,
+        {"error_message": "Workflow execution failed"},
+        None,
+        {
+            "error_message": "Workflow execution failed",
+            "state": "failed",
+            "end_time": ANY,
+        },
+        id="set_execution_error",
+    ),
+    pytest.param(
+        "cancel_execution",
+        _RUNNING_EXEC_JSON,
+        {},
+        True,
+        {"state": "cancelled", "end_time": ANY},
+        id="cancel_execution",
+    ),
+]
+
+# Default return value for each mocked Redis coroutine, restored between tests
+_REDIS_DEFAULTS = {
+    "ping": True,
+    "get": None,
+    "setex": True,
+    "lpush": 1,
+    "expire": True,
+    "lrange": [],
+}
+
+
+# TTL the manager gives every execution record it writes
+_EXECUTION_TTL = 86400
+
+# Keys every mocked scan_iter call yields
+_SCAN_KEYS = (b"workflow:execution:exec_1", b"workflow:execution:exec_2")
+
+
+class _AsyncListIter:
+    """Async iterator over a fixed sequence, without async-generator frames."""
+
+    def __init__(self, items):
+        self._it = iter(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._it)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+def _configure_redis(mock_client):
+    """Install the default Redis coroutines and scan_iter on a mock client."""
+    for name, value in _REDIS_DEFAULTS.items():
+        setattr(mock_client, name, AsyncMock(return_value=value))
+    mock_client.scan_iter = lambda pattern: _AsyncListIter(_SCAN_KEYS)
+
+
+@pytest.fixture(scope="module")
+def mock_redis():
+    """Mock Redis client shared by the module."""
+    mock_client = AsyncMock()
+    _configure_redis(mock_client)
+    return mock_client
+
+
+@pytest.fixture(scope="module")
+def state_manager(mock_redis):
+    """WorkflowStateManager instance with mocked Redis, shared by the module."""
+    return WorkflowStateManager()
+
+
+@pytest.fixture(autouse=True)
+def reset_redis(mock_redis, state_manager):
+    """Reset the whole shared mock and the manager's connection state per test."""
+    mock_redis.reset_mock(return_value=True, side_effect=True)
+    _configure_redis(mock_redis)
+    state_manager.redis_client = mock_redis
+    state_manager._connected = True
+    state_manager._memory_storage.clear()
+
+
+def _written(mock_redis, execution_id):
+    """Check the last setex call hit the execution key and TTL; decode its payload."""
+    key, ttl, payload = mock_redis.setex.call_args.args
+    assert key == f"workflow:execution:{execution_id}"
+    assert ttl == _EXECUTION_TTL
+    return _loads(payload)
+
+
+@pytest.mark.asyncio
 class TestWorkflowStateManager:
     """Test cases for WorkflowStateManager."""
 
-    @pytest.fixture
-    def mock_redis(self):
-        """Mock Redis client."""
-        mock_client = AsyncMock()
-        mock_client.ping = AsyncMock(return_value=True)
-        mock_client.get = AsyncMock(return_value=None)
-        mock_client.setex = AsyncMock(return_value=True)
-        mock_client.lpush = AsyncMock(return_value=1)
-        mock_client.expire = AsyncMock(return_value=True)
-        mock_client.lrange = AsyncMock(return_value=[])
-
-        # Mock scan_iter to return an async iterable
-        async def mock_scan_iter(pattern):
-            # Return some mock keys
-            yield b"workflow:execution:exec_1"
-            yield b"workflow:execution:exec_2"
-
-        mock_client.scan_iter = mock_scan_iter
-        return mock_client
-
-    @pytest.fixture
-    def state_manager(self, mock_redis):
-        """WorkflowStateManager instance with mocked Redis."""
-        manager = WorkflowStateManager()
-        manager.redis_client = mock_redis
-        manager._connected = True
-        return manager
-
-    @pytest.mark.asyncio
     async def test_connect_success(self, mock_redis):
         """Test successful Redis connection."""
         manager = WorkflowStateManager()
@@ -56,7 +222,6 @@ class TestWorkflowStateManager:
             assert manager.is_connected()
             mock_redis.ping.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_connect_failure(self, mock_redis):
         """Test Redis connection failure."""
         mock_redis.ping.side_effect = Exception("Connection failed")
@@ -69,7 +234,6 @@ class TestWorkflowStateManager:
             with pytest.raises(Exception, match="Connection failed"):
                 await manager.connect()
 
-    @pytest.mark.asyncio
     async def test_create_execution(self, state_manager, mock_redis):
         """Test creating a new workflow execution."""
         execution_id = await state_manager.create_execution(
@@ -79,148 +243,47 @@ class TestWorkflowStateManager:
         )
 
         assert execution_id.startswith("wf_exec_test_workflow_")
-        assert mock_redis.setex.called
         assert mock_redis.lpush.called
 
-        # Verify the stored data
-        call_args = mock_redis.setex.call_args
-        stored_data = json.loads(call_args[0][2])  # Third argument is the JSON data
+        # Verify the data written to Redis
+        stored_data = _written(mock_redis, execution_id)
         assert stored_data["workflow_id"] == "test_workflow"
         assert stored_data["workflow_name"] == "Test Workflow"
         assert stored_data["state"] == "pending"
         assert stored_data["input_data"] == {"param": "value"}
 
-    @pytest.mark.asyncio
-    async def test_update_execution_state(self, state_manager, mock_redis):
-        """Test updating execution state."""
-        # Mock existing execution data
-        existing_data = {
-            "execution_id": "test_exec_123",
-            "workflow_id": "test_workflow",
-            "workflow_name": "Test Workflow",
-            "state": "pending",
-            "start_time": datetime.now().isoformat(),
-            "input_data": {},
-            "vertex_states": {},
-        }
-        mock_redis.get.return_value = json.dumps(existing_data)
-
-        await state_manager.update_execution_state(
-            execution_id="test_exec_123",
-            state=WorkflowExecutionState.RUNNING,
-            current_vertex="vertex1",
-            progress_percentage=25.0,
-        )
-
-        # Verify update was called
-        assert mock_redis.setex.called
-        call_args = mock_redis.setex.call_args
-        updated_data = json.loads(call_args[0][2])
-        assert updated_data["state"] == "running"
-        assert updated_data["current_vertex"] == "vertex1"
-        assert updated_data["progress_percentage"] == 25.0
-
-    @pytest.mark.asyncio
-    async def test_update_vertex_state(self, state_manager, mock_redis):
-        """Test updating vertex execution state."""
-        # Mock existing execution data
-        existing_data = {
-            "execution_id": "test_exec_123",
-            "workflow_id": "test_workflow",
-            "workflow_name": "Test Workflow",
-            "state": "running",
-            "start_time": datetime.now().isoformat(),
-            "input_data": {},
-            "vertex_states": {},
-        }
-        mock_redis.get.return_value = json.dumps(existing_data)
-
-        await state_manager.update_vertex_state(
-            execution_id="test_exec_123",
-            vertex_id="vertex1",
-            state=VertexExecutionState.COMPLETED,
-            output_data={"result": "success"},
-        )
-
-        # Verify update was called
-        assert mock_redis.setex.called
-        call_args = mock_redis.setex.call_args
-        updated_data = json.loads(call_args[0][2])
-        assert "vertex1" in updated_data["vertex_states"]
-        vertex_state = updated_data["vertex_states"]["vertex1"]
-        assert vertex_state["state"] == "completed"
-        assert vertex_state["output_data"] == {"result": "success"}
-
-    @pytest.mark.asyncio
-    async def test_set_execution_output(self, state_manager, mock_redis):
-        """Test setting execution output."""
-        existing_data = {
-            "execution_id": "test_exec_123",
-            "workflow_id": "test_workflow",
-            "workflow_name": "Test Workflow",
-            "state": "running",
-            "start_time": datetime.now().isoformat(),
-            "input_data": {},
-            "vertex_states": {},
-        }
-        mock_redis.get.return_value = json.dumps(existing_data)
-
-        output_data = {"final_result": "workflow completed"}
-        await state_manager.set_execution_output("test_exec_123", output_data)
-
-        assert mock_redis.setex.called
-        call_args = mock_redis.setex.call_args
-        updated_data = json.loads(call_args[0][2])
-        assert updated_data["output_data"] == output_data
-
-    @pytest.mark.asyncio
-    async def test_set_execution_error(self, state_manager, mock_redis):
-        """Test setting execution error."""
-        existing_data = {
-            "execution_id": "test_exec_123",
-            "workflow_id": "test_workflow",
-            "workflow_name": "Test Workflow",
-            "state": "running",
-            "start_time": datetime.now().isoformat(),
-            "input_data": {},
-            "vertex_states": {},
-        }
-        mock_redis.get.return_value = json.dumps(existing_data)
-
-        error_message = "Workflow execution failed"
-        await state_manager.set_execution_error("test_exec_123", error_message)
-
-        assert mock_redis.setex.called
-        call_args = mock_redis.setex.call_args
-        updated_data = json.loads(call_args[0][2])
-        assert updated_data["error_message"] == error_message
-        assert updated_data["state"] == "failed"
-        assert "end_time" in updated_data
+    @pytest.mark.parametrize("method, seed, kwargs, returned, expected", _UPDATE_CASES)
+    async def test_update_ops(
+        self,
+        state_manager,
+        mock_redis,
+        method,
+        seed,
+        kwargs,
+        returned,
+        expected,
+    ):
+        """Test that each update op rewrites the stored execution."""
+        mock_redis.get.return_value = seed
+
+        result = await getattr(state_manager, method)("test_exec_123", **kwargs)
+
+        assert result is returned
+        updated_data = _written(mock_redis, "test_exec_123")
+        assert {key: updated_data[key] for key in expected} == expected
 
-    @pytest.mark.asyncio
     async def test_get_execution_status(self, state_manager, mock_redis):
         """Test getting execution status."""
-        execution_data = {
-            "execution_id": "test_exec_123",
-            "workflow_id": "test_workflow",
-            "workflow_name": "Test Workflow",
-            "state": "running",
-            "start_time": datetime.now().isoformat(),
-            "input_data": {"param": "value"},
-            "vertex_states": {},
-            "progress_percentage": 50.0,
-        }
-        mock_redis.get.return_value = json.dumps(execution_data)
+        mock_redis.get.return_value = _STATUS_EXEC_JSON
 
         status = await state_manager.get_execution_status("test_exec_123")
 
         assert status is not None
         assert status.execution_id == "test_exec_123"
         assert status.workflow_id == "test_workflow"
-        assert status.state == WorkflowExecutionState.RUNNING
+        assert status.state == _RUNNING
         assert status.progress_percentage == 50.0
 
-    @pytest.mark.asyncio
     async def test_get_execution_status_not_found(self, state_manager, mock_redis):
         """Test getting status for non-existent execution."""
         mock_redis.get.return_value = None
@@ -229,36 +292,13 @@ class TestWorkflowStateManager:
 
         assert status is None
 
-    @pytest.mark.asyncio
     async def test_get_workflow_executions(self, state_manager, mock_redis):
         """Test getting executions for a workflow."""
         # Mock execution IDs from Redis list
         mock_redis.lrange.return_value = [b"exec_1", b"exec_2"]
 
         # Mock execution data
-        exec_data_1 = {
-            "execution_id": "exec_1",
-            "workflow_id": "test_workflow",
-            "workflow_name": "Test Workflow",
-            "state": "completed",
-            "start_time": datetime.now().isoformat(),
-            "input_data": {},
-            "vertex_states": {},
-        }
-        exec_data_2 = {
-            "execution_id": "exec_2",
-            "workflow_id": "test_workflow",
-            "workflow_name": "Test Workflow",
-            "state": "failed",
-            "start_time": datetime.now().isoformat(),
-            "input_data": {},
-            "vertex_states": {},
-        }
-
-        mock_redis.get.side_effect = [
-            json.dumps(exec_data_1),
-            json.dumps(exec_data_2),
-        ]
+        mock_redis.get.side_effect = _WORKFLOW_EXECUTIONS_JSON
 
         executions = await state_manager.get_workflow_executions(
             "test_workflow", limit=5
@@ -268,83 +308,20 @@ class TestWorkflowStateManager:
         assert executions[0].execution_id == "exec_1"
         assert executions[1].execution_id == "exec_2"
 
-    @pytest.mark.asyncio
     async def test_get_active_executions(self, state_manager, mock_redis):
         """Test getting active executions."""
-        # Mock scan results
-        mock_redis.scan_iter.return_value = [
-            b"workflow:execution:exec_1",
-            b"workflow:execution:exec_2",
-        ]
-
-        # Mock execution data - one running, one completed
-        running_exec = {
-            "execution_id": "exec_1",
-            "workflow_id": "test_workflow",
-            "workflow_name": "Test Workflow",
-            "state": "running",
-            "start_time": datetime.now().isoformat(),
-            "input_data": {},
-            "vertex_states": {},
-        }
-        completed_exec = {
-            "execution_id": "exec_2",
-            "workflow_id": "test_workflow",
-            "workflow_name": "Test Workflow",
-            "state": "completed",
-            "start_time": datetime.now().isoformat(),
-            "input_data": {},
-            "vertex_states": {},
-        }
-
-        mock_redis.get.side_effect = [
-            json.dumps(running_exec),
-            json.dumps(completed_exec),
-        ]
+        # Scan yields _SCAN_KEYS; mock execution data - one running, one completed
+        mock_redis.get.side_effect = _ACTIVE_EXECUTIONS_JSON
 
         active_executions = await state_manager.get_active_executions()
 
         assert len(active_executions) == 1
         assert active_executions[0].execution_id == "exec_1"
-        assert active_executions[0].state == WorkflowExecutionState.RUNNING
-
-    @pytest.mark.asyncio
-    async def test_cancel_execution(self, state_manager, mock_redis):
-        """Test canceling a running execution."""
-        existing_data = {
-            "execution_id": "test_exec_123",
-            "workflow_id": "test_workflow",
-            "workflow_name": "Test Workflow",
-            "state": "running",
-            "start_time": datetime.now().isoformat(),
-            "input_data": {},
-            "vertex_states": {},
-        }
-        mock_redis.get.return_value = json.dumps(existing_data)
-
-        result = await state_manager.cancel_execution("test_exec_123")
-
-        assert result is True
-        assert mock_redis.setex.called
-
-        call_args = mock_redis.setex.call_args
-        updated_data = json.loads(call_args[0][2])
-        assert updated_data["state"] == "cancelled"
-        assert "end_time" in updated_data
+        assert active_executions[0].state == _RUNNING
 
-    @pytest.mark.asyncio
     async def test_cancel_execution_not_running(self, state_manager, mock_redis):
         """Test canceling a non-running execution."""
-        existing_data = {
-            "execution_id": "test_exec_123",
-            "workflow_id": "test_workflow",
-            "workflow_name": "Test Workflow",
-            "state": "completed",
-            "start_time": datetime.now().isoformat(),
-            "input_data": {},
-            "vertex_states": {},
-        }
-        mock_redis.get.return_value = json.dumps(existing_data)
+        mock_redis.get.return_value = _COMPLETED_EXEC_JSON
 
         result = await state_manager.cancel_execution("test_exec_123")
 
@@ -352,7 +329,6 @@ class TestWorkflowStateManager:
         # Should not update if not running
         assert not mock_redis.setex.called
 
-    @pytest.mark.asyncio
     async def test_cancel_execution_not_found(self, state_manager, mock_redis):
         """Test canceling a non-existent execution."""
         mock_redis.get.return_value = None
@@ -367,35 +343,19 @@ class TestWorkflowExecutionStatus:
 
     def test_to_dict(self):
         """Test converting status to dictionary."""
-        start_time = datetime.now()
-        status = WorkflowExecutionStatus(
-            execution_id="test_exec_123",
-            workflow_id="test_workflow",
-            workflow_name="Test Workflow",
-            state=WorkflowExecutionState.RUNNING,
-            start_time=start_time,
-            input_data={"param": "value"},
-            progress_percentage=75.5,
-        )
-
-        data = status.to_dict()
+        data = _SAMPLE_STATUS.to_dict()
 
         assert data["execution_id"] == "test_exec_123"
         assert data["workflow_id"] == "test_workflow"
         assert data["state"] == "running"
         assert data["progress_percentage"] == 75.5
         assert data["input_data"] == {"param": "value"}
-        assert "start_time" in data
+        assert data["start_time"] == _FIXED_TS
 
     def test_from_dict(self):
         """Test creating status from dictionary."""
-        start_time_str = datetime.now().isoformat()
         data = {
-            "execution_id": "test_exec_123",
-            "workflow_id": "test_workflow",
-            "workflow_name": "Test Workflow",
-            "state": "running",
-            "start_time": start_time_str,
+            **_RUNNING_EXEC,
             "input_data": {"param": "value"},
             "vertex_states": {},
             "progress_percentage": 75.5,
@@ -405,24 +365,19 @@ class TestWorkflowExecutionStatus:
 
         assert status.execution_id == "test_exec_123"
         assert status.workflow_id == "test_workflow"
-        assert status.state == WorkflowExecutionState.RUNNING
+        assert status.state == _RUNNING
         assert status.progress_percentage == 75.5
         assert status.input_data == {"param": "value"}
 
     def test_from_dict_with_vertex_states(self):
         """Test creating status from dictionary with vertex states."""
-        start_time_str = datetime.now().isoformat()
         data = {
-            "execution_id": "test_exec_123",
-            "workflow_id": "test_workflow",
-            "workflow_name": "Test Workflow",
-            "state": "running",
-            "start_time": start_time_str,
+            **_RUNNING_EXEC,
             "input_data": {},
             "vertex_states": {
                 "vertex1": {
                     "state": "completed",
-                    "updated_at": datetime.now().isoformat(),
+                    "updated_at": _FIXED_TS,
                     "output_data": {"result": "success"},
                 }
             },
@@ -433,5 +388,5 @@ class TestWorkflowExecutionStatus:
 
         assert "vertex1" in status.vertex_states
         vertex_state = status.vertex_states["vertex1"]
-        assert vertex_state["state"] == VertexExecutionState.COMPLETED
+        assert vertex_state["state"] == _COMPLETED
         assert vertex_state["output_data"] == {"result": "success"}